@@ -8,8 +8,8 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Optional, Tuple, Callable
 import numpy as np
-from PIL import Image, ImageTk
 import threading
+import gc
 
 
 class AreaSelector:
@@ -97,17 +97,25 @@ class AreaSelector:
         self.add_instructions()
     
     def convert_screenshot(self):
-        """Convert numpy screenshot to PhotoImage."""
+        """Convert numpy screenshot to PhotoImage via an in-memory PPM blit."""
         try:
-            # Convert to PIL Image
-            if len(self.screenshot.shape) == 3:
-                pil_image = Image.fromarray(self.screenshot.astype('uint8'))
-            else:
-                pil_image = Image.fromarray(self.screenshot.astype('uint8')).convert('RGB')
-            
-            # Convert to PhotoImage
-            self.photo = ImageTk.PhotoImage(pil_image)
-            print(f"✅ Screenshot converted for display: {pil_image.size}")
+            # No copy when the grab is already uint8 (the usual mss case)
+            image = self.screenshot.astype(np.uint8, copy=False)
+
+            # PPM (P6) expects packed HxWx3 RGB bytes
+            if image.ndim == 2:
+                image = np.repeat(image[:, :, None], 3, axis=2)
+            elif image.shape[2] == 4:
+                image = image[:, :, :3]
+
+            height, width = image.shape[:2]
+            header = b'P6\n%d %d\n255\n' % (width, height)
+            self.photo = tk.PhotoImage(
+                master=self.root,
+                data=header + np.ascontiguousarray(image).tobytes(),
+                format='PPM'
+            )
+            print(f"✅ Screenshot converted for display: {(width, height)}")
             
         except Exception as e:
             print(f"⚠️ Error converting screenshot: {e}")
@@ -232,6 +240,9 @@ class AreaSelector:
         try:
             if self.root:
                 try:
+                    # Drop the canvas image item so Tk releases the photo buffer
+                    if self.canvas:
+                        self.canvas.delete('all')
                     self.root.quit()  # Exit mainloop
                     self.root.destroy()  # Destroy window
                     print("✅ Area selector window closed")
@@ -246,6 +257,9 @@ class AreaSelector:
             self.canvas = None
             self.selection_rect = None
 
+            # Reclaim the full-screen buffers now rather than at the next GC cycle
+            gc.collect()
+
         except Exception as e:
             print(f"⚠️ Error in cleanup: {e}")
             self.root = None
@@ -8,70 +8,324 @@ import threading
 import time
 import re
 import os
+import json
+import shutil
+import hashlib
+from collections import OrderedDict
 from typing import Optional, List, Callable, Tuple
 import numpy as np
-from PIL import Image, ImageEnhance, ImageFilter
-import cv2
 
 # Handle both relative and absolute imports
 try:
-    from .debug_logger import debug_logger
+    from .debug_logger import debug_logger, _APP_DIR
 except ImportError:
-    from debug_logger import debug_logger
+    from debug_logger import debug_logger, _APP_DIR
 
-# OCR imports and auto-configuration
+# Optional faster non-cryptographic hash for OCR cache keys
 try:
-    import pytesseract
-    OCR_AVAILABLE = True
-    print("✅ OCR (pytesseract) available")
-
-    # Auto-detect bundled Tesseract
-    def setup_tesseract():
-        """Auto-detect and configure Tesseract path."""
-        import sys
-        import os
-
-        # Get the directory where the script/exe is located
-        if getattr(sys, 'frozen', False):
-            # Running as exe
-            app_dir = os.path.dirname(sys.executable)
-        else:
-            # Running as script
-            app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Tesseract's OpenMP threads cost more to spin up than they save on small
+# crops. Must be set before libtesseract loads or tesseract.exe is spawned (it inherits it).
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# OCR backend is imported and configured on first use (see _ensure_ocr) so
+# launching the overlay doesn't pay for OpenCV, pytesseract and the Tesseract probe
+cv2 = None
+pytesseract = None
+OCR_AVAILABLE = None  # Unknown until the first OCR attempt
+
+# Optional in-process libtesseract bindings; when present, the main OCR
+# passes reuse a loaded engine instead of spawning tesseract.exe each time
+tesserocr = None
+TESSEROCR_AVAILABLE = False
+TESSERACT_CONFIGURED = False
+_OCR_INIT_LOCK = threading.Lock()
+
+
+# Remembers the last Tesseract binary found so later launches skip the probe
+_TESSERACT_CACHE_FILE = os.path.join(_APP_DIR, "tesseract_path.json")
+
+# Tesseract binary resolved in this process
+_TESS_PATH = None
+
+
+def _bundled_tesseract() -> Optional[str]:
+    """
+    Locate the Tesseract shipped next to the app, if any.
+
+    Returns:
+        Path to the bundled tesseract.exe or None if not present
+    """
+    bundled_tesseract = os.path.join(_APP_DIR, 'tesseract', 'tesseract.exe')
+    return bundled_tesseract if os.path.exists(bundled_tesseract) else None
+
+
+def _find_tesseract() -> Optional[str]:
+    """
+    Probe the bundled and system install locations for Tesseract.
+
+    Returns:
+        Path to tesseract.exe or None if not found
+    """
+    # Bundled Tesseract first
+    bundled_tesseract = _bundled_tesseract()
+    if bundled_tesseract:
+        return bundled_tesseract
+
+    # Then whatever is on PATH (one lookup), then the default install dirs
+    on_path = shutil.which('tesseract')
+    if on_path:
+        return on_path
+
+    system_paths = [
+        r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+        r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe'
+    ]
+
+    for path in system_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def setup_tesseract():
+    """Auto-detect and configure Tesseract path."""
+    global _TESS_PATH
+
+    if _TESS_PATH is not None:
+        pytesseract.pytesseract.tesseract_cmd = _TESS_PATH
+        return True
+
+    # A bundled binary always wins, even over a system path cached earlier
+    path = _bundled_tesseract()
+    if path:
+        pytesseract.pytesseract.tesseract_cmd = _TESS_PATH = path
+        print(f"✅ Using bundled Tesseract: {path}")
+        return True
+
+    # Reuse the cached path while the binary is still there
+    try:
+        with open(_TESSERACT_CACHE_FILE, 'r') as f:
+            path = json.load(f).get('tesseract_cmd')
+        if path and os.path.isfile(path):
+            pytesseract.pytesseract.tesseract_cmd = _TESS_PATH = path
+            print(f"✅ Using cached Tesseract: {path}")
+            return True
+    except (OSError, ValueError, AttributeError):
+        pass
 
-        # Check for bundled Tesseract
-        bundled_tesseract = os.path.join(app_dir, 'tesseract', 'tesseract.exe')
+    path = _find_tesseract()
+    if path is None:
+        print("⚠️ Tesseract not found! Please install Tesseract OCR or use the bundled version.")
+        return False
 
-        if os.path.exists(bundled_tesseract):
-            pytesseract.pytesseract.tesseract_cmd = bundled_tesseract
-            print(f"✅ Using bundled Tesseract: {bundled_tesseract}")
-            return True
+    pytesseract.pytesseract.tesseract_cmd = _TESS_PATH = path
+    print(f"✅ Using Tesseract: {path}")
 
-        # Check system installation
-        system_paths = [
-            r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-            r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe'
-        ]
+    try:
+        with open(_TESSERACT_CACHE_FILE, 'w') as f:
+            json.dump({'tesseract_cmd': path}, f)
+    except OSError as e:
+        print(f"⚠️ Could not cache Tesseract path: {e}")
 
-        for path in system_paths:
-            if os.path.exists(path):
-                pytesseract.pytesseract.tesseract_cmd = path
-                print(f"✅ Using system Tesseract: {path}")
-                return True
+    return True
 
-        print("⚠️ Tesseract not found! Please install Tesseract OCR or use the bundled version.")
-        return False
 
-    # Setup Tesseract automatically
-    TESSERACT_CONFIGURED = setup_tesseract()
+def _ensure_ocr() -> bool:
+    """
+    Import OpenCV and pytesseract and configure Tesseract on first call.
 
-except ImportError:
-    OCR_AVAILABLE = False
-    TESSERACT_CONFIGURED = False
-    print("⚠️ OCR not available - install pytesseract")
+    Returns:
+        True if OCR is available
+    """
+    global pytesseract, OCR_AVAILABLE, TESSERACT_CONFIGURED, tesserocr, TESSEROCR_AVAILABLE
+
+    with _OCR_INIT_LOCK:
+        if OCR_AVAILABLE is None:
+            try:
+                _load_cv2()
+                import pytesseract as _pytesseract
+            except ImportError as e:
+                OCR_AVAILABLE = False
+                print(f"⚠️ OCR not available - install {e.name or 'pytesseract'}")
+            else:
+                pytesseract = _pytesseract
+                OCR_AVAILABLE = True
+                print("✅ OCR (pytesseract) available")
+                TESSERACT_CONFIGURED = setup_tesseract()
+
+                try:
+                    import tesserocr as _tesserocr
+                    tesserocr = _tesserocr
+                    TESSEROCR_AVAILABLE = True
+                    print("✅ Using in-process tesserocr engine")
+                except ImportError:
+                    pass
+
+    return OCR_AVAILABLE
+
+
+def _load_cv2():
+    """
+    Import OpenCV on first use.
+
+    Returns:
+        The cv2 module
+    """
+    global cv2
+
+    if cv2 is None:
+        import cv2 as _cv2
+        cv2 = _cv2
+    return cv2
+
+
+def _tessdata_path() -> str:
+    """
+    Find the tessdata directory next to the configured Tesseract binary.
+
+    Returns:
+        Directory path with trailing separator, or '' for tesserocr's default
+    """
+    tessdata = os.path.join(os.path.dirname(pytesseract.pytesseract.tesseract_cmd), 'tessdata')
+    return tessdata + os.sep if os.path.isdir(tessdata) else ''
+
+
+def _set_tess_image(api, image: np.ndarray, psm: int, whitelist: Optional[str]):
+    """
+    Load an image and pass settings into a reused tesserocr engine.
+
+    Args:
+        api: PyTessBaseAPI to configure
+        image: Grayscale uint8 image to recognize
+        psm: Tesseract page segmentation mode
+        whitelist: Characters tesseract may emit, or None for all
+    """
+    data = np.ascontiguousarray(image)
+    height, width = data.shape[:2]
+    channels = data.shape[2] if data.ndim == 3 else 1
+    api.SetPageSegMode(psm)
+    # Engines are reused, so always reset the whitelist from the last pass
+    api.SetVariable('tessedit_char_whitelist', whitelist or '')
+    api.SetImageBytes(data.tobytes(), width, height, channels, width * channels)
+
+
+def _tess_config(psm: int, whitelist: Optional[str]) -> str:
+    """
+    Build the pytesseract config string for one pass.
+
+    Args:
+        psm: Tesseract page segmentation mode
+        whitelist: Characters tesseract may emit, or None for all
+
+    Returns:
+        Command-line config for tesseract.exe
+    """
+    config = f'--psm {psm}'
+    if whitelist:
+        config += f' -c tessedit_char_whitelist={whitelist}'
+        config += ''.join(f' -c {name}={value}' for name, value in _NO_DICT_VARIABLES.items())
+    return config
 
 # Audio removed for clean minimal implementation
 
+# OCR preprocessing constants
+_SHARPEN_KERNEL = np.array([[0, -1, 0],
+                            [-1, 5, -1],
+                            [0, -1, 0]], dtype=np.float32)
+
+# Percentage token in OCR output, e.g. "42%" or "42.5%"
+_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+
+# Crop names shown in the in-game tooltip
+_CROP_RE = re.compile(r'coca|cannabis', re.IGNORECASE)
+
+# Characters a percentage reading can contain (digit-only OCR passes)
+_PCT_CHARS = '0123456789%'
+
+# Word dictionaries only help the full-text pass that reads crop names;
+# whitelisted passes skip loading them
+_NO_DICT_VARIABLES = {
+    'load_system_dawg': '0',
+    'load_freq_dawg': '0',
+    'load_punc_dawg': '0',
+    'load_number_dawg': '0',
+}
+
+# notifications_sent bits
+_NOTIFY_STAGE_TRANSITION = 1 << 0
+
+# Height (px) short OCR crops are enlarged towards, and the upscale limit
+_OCR_TARGET_HEIGHT = 120
+_OCR_MAX_UPSCALE = 3.0
+
+# Largest per-pixel change (0-255) between fingerprints still treated as noise
+_NOISE_TOLERANCE = 24
+
+# Number of distinct OCR inputs whose results are remembered
+_OCR_CACHE_SIZE = 128
+
+
+def rgb_to_gray(arr: np.ndarray) -> np.ndarray:
+    """
+    Convert an RGB/RGBA/grayscale array to 8-bit grayscale.
+
+    Uses ITU-R BT.601 weights (same as PIL 'L'); for uint8 input OpenCV
+    evaluates them in fixed-point integer SIMD.
+
+    Args:
+        arr: Image as numpy array
+
+    Returns:
+        Grayscale uint8 array (the input itself if already 8-bit gray)
+    """
+    _load_cv2()
+    arr = arr.astype(np.uint8, copy=False)
+    if arr.ndim == 2:
+        return arr
+    code = cv2.COLOR_RGBA2GRAY if arr.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+    return cv2.cvtColor(arr, code)
+
+
+def _noise_fingerprint(image: np.ndarray) -> np.ndarray:
+    """
+    Half-resolution grayscale copy used to spot near-identical frames.
+
+    Args:
+        image: Image as numpy array
+
+    Returns:
+        Grayscale uint8 array, 2x2 box-averaged to damp pixel noise
+    """
+    gray = rgb_to_gray(np.asarray(image))
+    if min(gray.shape) < 2:
+        return gray.copy()
+    return cv2.resize(gray, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+
+
+def _image_key(image: np.ndarray) -> bytes:
+    """
+    Build a compact cache key from an image's shape and raw pixels.
+
+    Args:
+        image: Image as numpy array
+
+    Returns:
+        8-byte digest (xxh64 when available, else blake2b)
+    """
+    data = np.ascontiguousarray(image)
+    shape = repr((data.shape, data.dtype.str)).encode()
+    if XXHASH_AVAILABLE:
+        hasher = xxhash.xxh64(shape)
+    else:
+        hasher = hashlib.blake2b(shape, digest_size=8)
+    hasher.update(data)
+    return hasher.digest()
+
 
 class CocaTimer:
     """COCA Timer with OCR percentage detection."""
@@ -86,16 +340,34 @@ class CocaTimer:
         self.update_callback = update_callback
         self.timer_thread = None
         self.running = False
+        self._cond = threading.Condition()  # Guards timer state, wakes the loop on stop()
         self.time_left = 38 * 60  # Default 38 minutes
         self.original_time = 38 * 60
-        self.notifications_sent = set()  # Track sent notifications
+        self.notifications_sent = 0  # Bitmask of sent notifications
 
         # Plant lifecycle stages
         self.current_stage = "growing"  # growing, ready, flowering, seeding
         self.crop_type = "coca"  # coca or marijuana
         self.planter_type = "basic"  # basic or planter_box
 
-        # Tesseract is auto-configured on import
+        # Persistent tesserocr engines keyed by "constrained"; created once
+        # and used only while holding _tess_lock
+        self._tess_apis = {}
+        self._tess_lock = threading.RLock()
+
+        # "fast" runs the standard pass only; "thorough" also tries the
+        # extra preprocessing methods when that finds no percentage
+        # (set from the "ocr_mode" config key)
+        self.ocr_mode = "fast"
+
+        # LRU of raw-image hash -> (percentage, crop_type)
+        self._ocr_cache = OrderedDict()
+
+        # Fingerprint and result of the last successful read
+        self._last_fingerprint = None
+        self._last_result = (None, None)
+
+        # Tesseract is auto-configured on first detection
     
 
     
@@ -109,7 +381,7 @@ class CocaTimer:
         Returns:
             Tuple of (percentage, crop_type) where crop_type is 'coca', 'marijuana', or None
         """
-        if not OCR_AVAILABLE:
+        if not _ensure_ocr():
             print("❌ OCR not available")
             return None, None
 
@@ -126,20 +398,9 @@ class CocaTimer:
             # Save debug screenshot (only if debug logging is enabled)
             debug_logger.save_debug_screenshot(image, "original")
 
-            # Convert to PIL Image with error handling
-            pil_image = None
-            try:
-                if len(image.shape) == 3:
-                    pil_image = Image.fromarray(image.astype('uint8'))
-                else:
-                    pil_image = Image.fromarray(image.astype('uint8')).convert('RGB')
-                debug_logger.log_image_processing("PIL conversion", True, f"Size: {pil_image.size}")
-            except Exception as e:
-                debug_logger.log_image_processing("PIL conversion", False, str(e))
-                return None, None
-
             # Use enhanced OCR to extract both percentage and crop type
-            percentage, crop_type = self._extract_percentage_and_crop(pil_image)
+            # (enhancement works on the numpy buffer directly)
+            percentage, crop_type = self._extract_percentage_and_crop(image)
 
             if percentage is not None:
                 crop_info = f" (crop: {crop_type})" if crop_type else ""
@@ -168,415 +429,297 @@ class CocaTimer:
         percentage, _ = self.detect_percentage_and_crop(image)
         return percentage
 
-    def _extract_percentage_and_crop(self, image: Image.Image) -> Tuple[Optional[float], Optional[str]]:
+    def _extract_percentage_and_crop(self, image: np.ndarray) -> Tuple[Optional[float], Optional[str]]:
         """
         Extract both percentage and crop type from OCR text.
 
         Args:
-            image: PIL Image to process
+            image: Screenshot as numpy array
 
         Returns:
             Tuple of (percentage, crop_type) where crop_type is 'coca', 'marijuana', or None
         """
         try:
+            # Frames that differ from the last successful read only by
+            # low-amplitude noise (compression, dithering) reuse its result;
+            # any glyph change moves some pixels far beyond the tolerance
+            fingerprint = _noise_fingerprint(image)
+            last = self._last_fingerprint
+            if (last is not None and last.shape == fingerprint.shape
+                    and cv2.absdiff(fingerprint, last).max() <= _NOISE_TOLERANCE):
+                debug_logger.log("DEBUG", f"Near-identical frame, reusing: {self._last_result}")
+                return self._last_result
+
+            # Identical crops produce identical OCR output - skip both the
+            # enhancement and tesseract
+            cache_key = _image_key(image)
+            cached = self._ocr_cache.get(cache_key)
+            if cached is not None:
+                self._ocr_cache.move_to_end(cache_key)
+                debug_logger.log("DEBUG", f"OCR cache hit: {cached}")
+                return cached
+
             # Use enhanced OCR to get full text
             enhanced = self.enhance_image_for_ocr(image)
-            debug_logger.save_debug_screenshot(np.array(enhanced), "enhanced")
-
-            # Use broader OCR config to capture more text including crop names
-            configs = [
-                '--psm 6',  # Uniform block of text
-                '--psm 8',  # Single word
-                '--psm 7',  # Single text line
+            debug_logger.save_debug_screenshot(enhanced, "enhanced")
+
+            # One uniform-block pass normally finds everything; fall back to
+            # single-word segmentation only when no percentage was found.
+            # No character whitelist so crop names are captured too.
+            psm_modes = [
+                6,  # Uniform block of text
+                8,  # Single word (fallback)
             ]
 
             best_percentage = None
             detected_crop = None
 
-            for config in configs:
+            for psm in psm_modes:
                 try:
-                    # Get full text without character restrictions for crop detection
-                    full_text = pytesseract.image_to_string(enhanced, config=config)
-                    debug_logger.log_ocr_attempt("Full Text OCR", config, full_text, True)
+                    full_text = self._ocr_text(enhanced, psm)
+                    debug_logger.log_ocr_attempt("Full Text OCR", f"--psm {psm}", full_text, True)
 
                     # Extract percentage from text
                     percentages = self.extract_percentages(full_text)
-                    if percentages and best_percentage is None:
+                    if percentages:
                         best_percentage = min(percentages)
 
                     # Extract crop type from text
                     if detected_crop is None:
                         detected_crop = self.extract_crop_type(full_text)
 
-                    # If we have both, we can stop
-                    if best_percentage is not None and detected_crop is not None:
+                    if best_percentage is not None:
                         break
 
                 except Exception as e:
-                    debug_logger.log("WARNING", f"OCR failed with {config}: {e}")
+                    debug_logger.log("WARNING", f"OCR failed with --psm {psm}: {e}")
                     continue
 
+            # Thorough mode falls back to the slower preprocessing variants
+            if best_percentage is None and self.ocr_mode == "thorough":
+                try:
+                    from .ocr_methods_extra import run_thorough
+                except ImportError:
+                    from ocr_methods_extra import run_thorough
+                best_percentage = run_thorough(self, image)
+
             debug_logger.log("INFO", f"Extracted - Percentage: {best_percentage}%, Crop: {detected_crop}")
+
+            self._ocr_cache[cache_key] = (best_percentage, detected_crop)
+            if len(self._ocr_cache) > _OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+
+            if best_percentage is not None:
+                self._last_fingerprint = fingerprint
+                self._last_result = (best_percentage, detected_crop)
+
             return best_percentage, detected_crop
 
         except Exception as e:
             debug_logger.log("ERROR", f"_extract_percentage_and_crop failed: {e}")
             return None, None
 
-    def extract_crop_type(self, text: str) -> Optional[str]:
+    def _ocr_text(self, image: np.ndarray, psm: int, whitelist: Optional[str] = None) -> str:
         """
-        Extract crop type from OCR text.
+        Run a single tesseract pass and join the recognized tokens.
 
         Args:
-            text: OCR text to analyze
+            image: Grayscale uint8 image to recognize
+            psm: Tesseract page segmentation mode
+            whitelist: Characters tesseract may emit, or None for all
 
         Returns:
-            'coca', 'marijuana', or None if not detected
+            Space-joined recognized text
         """
-        try:
-            # Convert to lowercase for case-insensitive matching
-            text_lower = text.lower()
-
-            # Look for specific crop type keywords only
-            if 'coca' in text_lower:
-                return 'coca'
-            elif 'cannabis' in text_lower:
-                return 'marijuana'
-
-            return None
-
-        except Exception as e:
-            debug_logger.log("ERROR", f"Error extracting crop type: {e}")
-            return None
-
-    def _method_standard_enhanced_legacy(self, image: Image.Image) -> Optional[float]:
-        """Legacy method for backward compatibility."""
-        try:
-            enhanced = self.enhance_image_for_ocr(image)
-            debug_logger.save_debug_screenshot(np.array(enhanced), "enhanced")
-
-            # Only use the most effective PSM modes for speed
-            configs = [
-                '--psm 6 -c tessedit_char_whitelist=0123456789%',
-                '--psm 8 -c tessedit_char_whitelist=0123456789%'
-            ]
-
-            for config in configs:
-                text = pytesseract.image_to_string(enhanced, config=config)
-                debug_logger.log_ocr_attempt("Standard Enhanced", config, text, '%' in text)
+        with self._tess_lock:
+            api = self._tess_api(constrained=bool(whitelist))
+            if api is not None:
+                _set_tess_image(api, image, psm, whitelist)
+                return ' '.join(api.GetUTF8Text().split())
 
-                percentages = self.extract_percentages(text)
-                if percentages:
-                    debug_logger.log_percentage_extraction(text, percentages, "Standard Enhanced")
-                    return min(percentages)
+        data = pytesseract.image_to_data(image, config=_tess_config(psm, whitelist),
+                                         output_type=pytesseract.Output.DICT)
+        return ' '.join(token for token in data['text'] if token.strip())
 
-            all_results = []
-
-            for method_name, method_func in methods:
-
-                try:
-                    result = method_func(pil_image)
-                    if result is not None:
-                        all_results.append((method_name, result))
-
-                    else:
-                        pass
-                except Exception as e:
-                    print(f"⚠️ {method_name} failed: {e}")
-
-            # Choose best result (prefer non-zero values)
-            if all_results:
-                # Filter out 0% results if we have other options
-                non_zero_results = [(name, val) for name, val in all_results if val > 0]
-
-                if non_zero_results:
-                    # Use the first non-zero result
-                    best_method, best_result = non_zero_results[0]
-                else:
-                    # Use the first result even if it's 0%
-                    best_method, best_result = all_results[0]
-
-                print(f"🔍 COCA OCR: Detected {best_result}% using {best_method}")
-                debug_logger.log("INFO", f"� All results: {all_results}")
-                return best_result
-            else:
-                debug_logger.log_final_result(None)
-                return None
-
-        except Exception as e:
-            debug_logger.log("ERROR", f"⚠️ Critical OCR detection error: {e}")
-            return None
+    def _ocr_words(self, image: np.ndarray, psm: int, whitelist: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Run a single tesseract pass and return each recognized word with its top edge.
 
-    def _method_standard_enhanced(self, image: Image.Image) -> Optional[float]:
-        """Fast standard enhanced OCR method."""
-        try:
-            enhanced = self.enhance_image_for_ocr(image)
-            debug_logger.save_debug_screenshot(np.array(enhanced), "enhanced")
+        Args:
+            image: Grayscale uint8 image to recognize
+            psm: Tesseract page segmentation mode
+            whitelist: Characters tesseract may emit, or None for all
 
-            # Only use the most effective PSM modes for speed
-            configs = [
-                '--psm 6 -c tessedit_char_whitelist=0123456789%',
-                '--psm 8 -c tessedit_char_whitelist=0123456789%'
-            ]
+        Returns:
+            (word, top) pairs in reading order
+        """
+        with self._tess_lock:
+            api = self._tess_api(constrained=bool(whitelist))
+            if api is not None:
+                _set_tess_image(api, image, psm, whitelist)
+                api.Recognize()
+                iterator = api.GetIterator()
+                if iterator is None:
+                    return []
+                words = []
+                for word in tesserocr.iterate_level(iterator, tesserocr.RIL.WORD):
+                    token = word.GetUTF8Text(tesserocr.RIL.WORD)
+                    if token and token.strip():
+                        words.append((token, word.BoundingBox(tesserocr.RIL.WORD)[1]))
+                return words
+
+        data = pytesseract.image_to_data(image, config=_tess_config(psm, whitelist),
+                                         output_type=pytesseract.Output.DICT)
+        return [(token, top) for token, top in zip(data['text'], data['top']) if token.strip()]
+
+    def _tess_api(self, constrained: bool = False):
+        """
+        Get the persistent tesserocr engine, creating it on first use.
 
-            for config in configs:
-                text = pytesseract.image_to_string(enhanced, config=config)
-                debug_logger.log_ocr_attempt("Standard Enhanced", config, text, '%' in text)
+        Callers must hold _tess_lock while using the engine.
 
-                percentages = self.extract_percentages(text)
-                if percentages:
-                    debug_logger.log_percentage_extraction(text, percentages, "Standard Enhanced")
-                    return min(percentages)
+        Args:
+            constrained: Get the engine initialised without dictionaries,
+                for whitelisted passes that never read words
 
+        Returns:
+            PyTessBaseAPI instance, or None when tesserocr is unavailable
+        """
+        if not TESSEROCR_AVAILABLE:
             return None
-        except Exception as e:
-            debug_logger.log("ERROR", f"Standard Enhanced method failed: {e}")
-            return None
-
-    def _method_binary_threshold_specific(self, image: Image.Image, threshold: int) -> Optional[float]:
-        """Binary threshold OCR method with specific threshold value for white text with black outlines."""
-        try:
-            debug_logger.log("DEBUG", f"🔬 Testing binary threshold: {threshold}")
-
-            # Convert to grayscale
-            gray = image.convert('L')
-
-            # Apply specific binary threshold
-            # For white text with black outlines, we want to keep white pixels (above threshold)
-            binary = gray.point(lambda x: 255 if x > threshold else 0, mode='1')
-            binary_rgb = binary.convert('RGB')
 
-            debug_logger.save_debug_screenshot(np.array(binary_rgb), f"binary_{threshold}")
+        with self._tess_lock:
+            api = self._tess_apis.get(constrained)
+            if api is not None:
+                return api
 
-            # Try multiple PSM modes for better detection
-            configs = [
-                '--psm 6 -c tessedit_char_whitelist=0123456789%',
-                '--psm 8 -c tessedit_char_whitelist=0123456789%',
-                '--psm 7 -c tessedit_char_whitelist=0123456789%',
-                '--psm 13 -c tessedit_char_whitelist=0123456789%'
-            ]
+            try:
+                # Dictionary loading is an init-only setting, hence a
+                # separate engine rather than SetVariable per pass
+                api = tesserocr.PyTessBaseAPI(path=_tessdata_path(), init=False)
+                api.InitFull(path=_tessdata_path(),
+                             variables=_NO_DICT_VARIABLES if constrained else {})
+            except Exception as e:
+                debug_logger.log("WARNING", f"tesserocr init failed, using pytesseract: {e}")
+                return None
+            self._tess_apis[constrained] = api
+            return api
 
-            for config in configs:
+    def close(self):
+        """Stop the timer and release the persistent OCR engines."""
+        self.stop()
+        with self._tess_lock:
+            for api in self._tess_apis.values():
                 try:
-                    text = pytesseract.image_to_string(binary_rgb, config=config)
-                    debug_logger.log_ocr_attempt(f"Binary {threshold}", config, text, '%' in text)
-
-                    percentages = self.extract_percentages(text)
-                    if percentages:
-                        debug_logger.log_percentage_extraction(text, percentages, f"Binary {threshold}")
-                        return min(percentages)
-                except Exception as e:
-                    debug_logger.log("WARNING", f"OCR failed for Binary {threshold} with {config}: {e}")
-                    continue
-
-            return None
-        except Exception as e:
-            debug_logger.log("ERROR", f"Binary Threshold {threshold} method failed: {e}")
-            return None
-
-
-
-    def _method_high_contrast(self, image: Image.Image) -> Optional[float]:
-        """Fast high contrast OCR method."""
-        try:
-            # Increase contrast dramatically
-            contrast_enhancer = ImageEnhance.Contrast(image)
-            high_contrast = contrast_enhancer.enhance(3.0)
+                    api.End()
+                except Exception:
+                    pass
+            self._tess_apis.clear()
 
-            # Increase brightness
-            brightness_enhancer = ImageEnhance.Brightness(high_contrast)
-            bright = brightness_enhancer.enhance(1.5)
-
-            debug_logger.save_debug_screenshot(np.array(bright), "high_contrast")
-
-            # Only use the most effective PSM mode for speed
-            text = pytesseract.image_to_string(bright, config='--psm 6 -c tessedit_char_whitelist=0123456789%')
-            debug_logger.log_ocr_attempt("High Contrast", "--psm 6", text, '%' in text)
-
-            percentages = self.extract_percentages(text)
-            if percentages:
-                debug_logger.log_percentage_extraction(text, percentages, "High Contrast")
-                return min(percentages)
-
-            return None
-        except Exception as e:
-            debug_logger.log("ERROR", f"High Contrast method failed: {e}")
-            return None
-
-
-
-    def _method_grayscale_sharpen(self, image: Image.Image) -> Optional[float]:
-        """Grayscale with sharpening OCR method."""
-        try:
-            # Convert to grayscale
-            gray = image.convert('L')
-
-            # Apply sharpening filter
-            sharpened = gray.filter(ImageFilter.SHARPEN)
-
-            # Convert back to RGB for OCR
-            rgb = sharpened.convert('RGB')
-
-            debug_logger.save_debug_screenshot(np.array(rgb), "grayscale_sharp")
+    def extract_crop_type(self, text: str) -> Optional[str]:
+        """
+        Extract crop type from OCR text.
 
-            configs = [
-                '--psm 6 -c tessedit_char_whitelist=0123456789%',
-                '--psm 8 -c tessedit_char_whitelist=0123456789%'
-            ]
+        Args:
+            text: OCR text to analyze
 
-            for config in configs:
-                text = pytesseract.image_to_string(rgb, config=config)
-                debug_logger.log_ocr_attempt("Grayscale + Sharpen", config, text, '%' in text)
+        Returns:
+            'coca', 'marijuana', or None if not detected
+        """
+        # One case-insensitive scan; coca wins when both names appear
+        found = {match.lower() for match in _CROP_RE.findall(text)}
+        if 'coca' in found:
+            return 'coca'
+        if found:
+            return 'marijuana'
+        return None
+
+    def enhance_image_for_ocr(self, img) -> np.ndarray:
+        """
+        Enhance image for better OCR accuracy.
 
-                percentages = self.extract_percentages(text)
-                if percentages:
-                    debug_logger.log_percentage_extraction(text, percentages, "Grayscale + Sharpen")
-                    return min(percentages)
+        Runs grayscale, contrast, sharpen and rescale on the raw pixel
+        buffer. Contrast and sharpen are skipped for crops that are
+        already high-contrast.
 
-            return None
-        except Exception as e:
-            debug_logger.log("ERROR", f"Grayscale + Sharpen method failed: {e}")
-            return None
+        Args:
+            img: Screenshot as numpy array (or PIL Image)
 
-    def _method_morphological(self, image: Image.Image) -> Optional[float]:
-        """Morphological operations OCR method."""
+        Returns:
+            Enhanced grayscale uint8 array, passed to tesseract as-is
+        """
+        _load_cv2()
         try:
-            # Convert PIL to OpenCV
-            cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
-            # Convert to grayscale
-            gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
-
-            # Apply morphological operations
-            kernel = np.ones((2, 2), np.uint8)
-            morph = cv2.morphologyEx(gray, cv2.MORPH_CLOSE, kernel)
-
-            # Convert back to PIL
-            morph_pil = Image.fromarray(morph).convert('RGB')
-
-            debug_logger.save_debug_screenshot(np.array(morph_pil), "morphological")
-
-            configs = [
-                '--psm 6 -c tessedit_char_whitelist=0123456789%',
-                '--psm 8 -c tessedit_char_whitelist=0123456789%'
-            ]
-
-            for config in configs:
-                text = pytesseract.image_to_string(morph_pil, config=config)
-                debug_logger.log_ocr_attempt("Morphological", config, text, '%' in text)
-
-                percentages = self.extract_percentages(text)
-                if percentages:
-                    debug_logger.log_percentage_extraction(text, percentages, "Morphological")
-                    return min(percentages)
-
-            return None
+            gray = self._preprocess_gray(img)
+
+            # Enlarge short crops towards the working height (at most 3x).
+            # Taller crops are usually multi-line selections whose glyphs
+            # are no bigger than a single line's, so they are never shrunk
+            height, width = gray.shape
+            scale = min(_OCR_MAX_UPSCALE, max(1.0, _OCR_TARGET_HEIGHT / height))
+            if scale > 1.05:
+                size = (max(1, round(width * scale)), max(1, round(height * scale)))
+                gray = cv2.resize(gray, size, interpolation=cv2.INTER_CUBIC)
+
+            return gray
         except Exception as e:
-            debug_logger.log("ERROR", f"Morphological method failed: {e}")
-            return None
-
-    def _method_multi_scale(self, image: Image.Image) -> Optional[float]:
-        """Multi-scale OCR method."""
-        try:
-            scales = [1.5, 2.0, 2.5]
-
-            for scale in scales:
-                # Scale up the image
-                new_size = (int(image.width * scale), int(image.height * scale))
-                scaled = image.resize(new_size, Image.Resampling.LANCZOS)
-
-                # Apply enhancement
-                enhanced = self.enhance_image_for_ocr(scaled)
-
-                debug_logger.save_debug_screenshot(np.array(enhanced), f"multi_scale_{scale}")
+            print(f"⚠️ Error enhancing image: {e}")
+            return np.asarray(img)
 
-                configs = [
-                    '--psm 6 -c tessedit_char_whitelist=0123456789%',
-                    '--psm 8 -c tessedit_char_whitelist=0123456789%'
-                ]
+    def _preprocess_gray(self, img) -> np.ndarray:
+        """
+        Grayscale, contrast and sharpen an image at its native resolution.
 
-                for config in configs:
-                    text = pytesseract.image_to_string(enhanced, config=config)
-                    debug_logger.log_ocr_attempt(f"Multi-Scale {scale}x", config, text, '%' in text)
+        Args:
+            img: Screenshot as numpy array (or PIL Image)
 
-                    percentages = self.extract_percentages(text)
-                    if percentages:
-                        debug_logger.log_percentage_extraction(text, percentages, f"Multi-Scale {scale}x")
-                        return min(percentages)
+        Returns:
+            Grayscale uint8 array
+        """
+        gray = rgb_to_gray(np.asarray(img))
 
-            return None
-        except Exception as e:
-            debug_logger.log("ERROR", f"Multi-Scale method failed: {e}")
-            return None
+        # Crops that are already mostly near-black/near-white need no
+        # contrast or sharpening (and those passes can hurt OCR there)
+        hist = np.bincount(gray.ravel(), minlength=256)
+        if hist[:32].sum() + hist[224:].sum() <= 0.8 * gray.size:
+            # Increase contrast around the mean, like ImageEnhance.Contrast(2.0)
+            mean = int(gray.mean() + 0.5)
+            gray = np.clip(gray * 2.0 - mean, 0, 255).astype(np.uint8)
 
-    def enhance_image_for_ocr(self, img: Image.Image) -> Image.Image:
-        """Enhance image for better OCR accuracy."""
-        try:
-            # Convert to grayscale
-            img = img.convert('L')
-            
-            # Increase contrast
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(2.0)
-            
             # Increase sharpness
-            enhancer = ImageEnhance.Sharpness(img)
-            img = enhancer.enhance(2.0)
-            
-            # Scale up for better OCR
-            width, height = img.size
-            img = img.resize((width * 3, height * 3), Image.Resampling.LANCZOS)
-            
-            return img
-        except Exception as e:
-            print(f"⚠️ Error enhancing image: {e}")
-            return img
+            gray = cv2.filter2D(gray, -1, _SHARPEN_KERNEL, borderType=cv2.BORDER_REPLICATE)
+
+        return gray
     
     def extract_percentages(self, text: str) -> List[float]:
         """Extract percentage values from OCR text."""
-        try:
-            # Find all percentage patterns
-            pattern = r'(\d+(?:\.\d+)?)%'
-            matches = re.findall(pattern, text)
-            
-            percentages = []
-            for match in matches:
-                try:
-                    percentage = float(match)
-                    if 0 <= percentage <= 100:  # Valid percentage range
-                        percentages.append(percentage)
-                except ValueError:
-                    continue
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_percentages = []
-            for p in percentages:
-                if p not in seen:
-                    seen.add(p)
-                    unique_percentages.append(p)
-            
-            return unique_percentages
-        except Exception as e:
-            print(f"⚠️ Error extracting percentages: {e}")
+        # Most failed OCR passes contain no '%' at all; a substring
+        # check is far cheaper than running the regex over them
+        if '%' not in text:
             return []
+
+        # Convert, range-check and dedupe (order preserved) in a single pass;
+        # the regex only matches parseable floats, so nothing here can raise
+        values = map(float, _PCT_RE.findall(text))
+        return list(dict.fromkeys(v for v in values if 0.0 <= v <= 100.0))
     
     def start(self, initial_time: int = None, crop_type: str = "coca", planter_type: str = "basic"):
         """Start the countdown timer with plant lifecycle support."""
         if self.running:
             self.stop()
 
-        if initial_time is not None:
-            self.time_left = initial_time
-            self.original_time = initial_time
+        with self._cond:
+            if initial_time is not None:
+                self.time_left = initial_time
+                self.original_time = initial_time
 
-        # Set plant configuration
-        self.crop_type = crop_type
-        self.planter_type = planter_type
-        self.current_stage = "growing"
+            # Set plant configuration
+            self.crop_type = crop_type
+            self.planter_type = planter_type
+            self.current_stage = "growing"
 
-        self.running = True
-        self.notifications_sent.clear()
+            self.running = True
+            self.notifications_sent = 0
 
         # Start timer thread
         self.timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
@@ -586,18 +729,23 @@ class CocaTimer:
     
     def stop(self):
         """Stop the timer."""
-        self.running = False
-        if self.timer_thread:
-            self.timer_thread.join(timeout=1)
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        if self.timer_thread and self.timer_thread is not threading.current_thread():
+            self.timer_thread.join()
         print("⏹️ COCA timer stopped")
     
     def reset(self):
         """Reset the timer to original time."""
         was_running = self.running
         self.stop()
-        self.time_left = self.original_time
-        self.current_stage = "growing"
-        self.notifications_sent.clear()
+        with self._cond:
+            self.time_left = self.original_time
+            self.current_stage = "growing"
+            self.notifications_sent = 0
+        self._ocr_cache.clear()
+        self._last_fingerprint = None
         self.update_callback(self.time_left, "Reset")
 
         if was_running:
@@ -607,29 +755,34 @@ class CocaTimer:
     
     def _timer_loop(self):
         """Main timer loop with multi-stage plant lifecycle support."""
-        update_counter = 0
-
-        while self.running:
-            # Update display every 100ms for smooth percentage counting
-            status = self._get_current_status()
-            self.update_callback(self.time_left, status)
-
-            # Wait 100ms for smooth updates
-            time.sleep(0.1)
-            update_counter += 1
+        # Ticks fall on whole seconds from a monotonic origin so late wakeups
+        # don't accumulate drift; stop() wakes the wait immediately. The UI
+        # interpolates the growing percentage between ticks on its own.
+        t0 = time.monotonic()
+        tick = 0
+
+        while True:
+            with self._cond:
+                if not self.running:
+                    break
+                status = self._get_current_status()
+                time_left = self.time_left
+
+            self.update_callback(time_left, status)
+
+            tick += 1
+            with self._cond:
+                timeout = max(0.0, t0 + tick - time.monotonic())
+                if self._cond.wait_for(lambda: not self.running, timeout):
+                    break
 
-            # Decrease time only every 10 updates (every 1 second)
-            if self.running and update_counter >= 10:
                 if self.current_stage != "seeding":  # Seeding stage has no timer
                     self.time_left -= 1
-                update_counter = 0
 
                 # Check for stage transitions
                 if self.time_left <= 0:
                     self._advance_to_next_stage()
 
-        self.running = False
-
     def _get_current_status(self):
         """Get the current status string based on stage."""
         if self.current_stage == "growing":
@@ -649,9 +802,9 @@ class CocaTimer:
             # Growing completed, move to Ready stage
             self.current_stage = "ready"
             self.time_left = self._get_ready_duration()
-            self.notifications_sent.clear()
+            self.notifications_sent = 0
             # Signal to stop any flashing from previous stage and play completion sound
-            self.notifications_sent.add("stage_transition")
+            self.notifications_sent |= _NOTIFY_STAGE_TRANSITION
             self.update_callback(self.time_left, "stage_completed_growing")
             print(f"🌱 Growing completed! Ready stage: {self.time_left//60}:{self.time_left%60:02d}")
 
@@ -659,9 +812,9 @@ class CocaTimer:
             # Ready completed, move to Flowering stage
             self.current_stage = "flowering"
             self.time_left = self._get_flowering_duration()
-            self.notifications_sent.clear()
+            self.notifications_sent = 0
             # Signal to stop any flashing from previous stage and play completion sound
-            self.notifications_sent.add("stage_transition")
+            self.notifications_sent |= _NOTIFY_STAGE_TRANSITION
             self.update_callback(self.time_left, "stage_completed_ready")
             print(f"🌸 Ready completed! Flowering stage: {self.time_left//60}:{self.time_left%60:02d}")
 
@@ -669,9 +822,9 @@ class CocaTimer:
             # Flowering completed, move to Seeding stage
             self.current_stage = "seeding"
             self.time_left = -1  # Infinite symbol
-            self.notifications_sent.clear()
+            self.notifications_sent = 0
             # Signal to stop any flashing from previous stage and play completion sound
-            self.notifications_sent.add("stage_transition")
+            self.notifications_sent |= _NOTIFY_STAGE_TRANSITION
             self.update_callback(self.time_left, "stage_completed_flowering")
             print(f"🌾 Flowering completed! Seeding stage (infinite)")
 
@@ -6,12 +6,131 @@ Provides detailed logging for OCR detection and screenshot analysis.
 import os
 import sys
 import logging
+import logging.handlers
+import atexit
+import hashlib
+import queue
+import threading
 import datetime
 from pathlib import Path
 from typing import Optional, Any
 import numpy as np
 from PIL import Image
 
+# Level names accepted by DebugLogger.log()
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+
+def _get_app_dir() -> str:
+    """Get the directory where the script/exe is located."""
+    if getattr(sys, 'frozen', False):
+        # Running as exe
+        return os.path.dirname(sys.executable)
+    # Running as script
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+_APP_DIR = _get_app_dir()
+
+
+class _BatchedFileHandler(logging.handlers.BufferingHandler):
+    """Buffer log records and write each batch to the file in a single call."""
+
+    def __init__(self, filename: str, capacity: int = 1024, interval: float = 1.0,
+                 max_bytes: int = 4 * 1024 * 1024, backup_count: int = 2):
+        """
+        Open the log file and start the periodic flush.
+
+        Args:
+            filename: Log file path; the previous session's log is kept as a backup
+            capacity: Records buffered before a forced flush
+            interval: Seconds between background flushes
+            max_bytes: Approximate size at which the file is rolled over
+            backup_count: Number of rolled-over files kept (filename.1, .2, ...)
+        """
+        super().__init__(capacity)
+        self._filename = filename
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._stream = None
+        self._size = 0
+        self._rollover()
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_periodically, args=(interval,), daemon=True).start()
+
+    def _rollover(self):
+        """Shift the backups along and start a fresh log file."""
+        if self._stream is not None:
+            self._stream.close()
+        for i in range(self._backup_count, 0, -1):
+            source = f"{self._filename}.{i - 1}" if i > 1 else self._filename
+            if os.path.exists(source):
+                try:
+                    os.replace(source, f"{self._filename}.{i}")
+                except OSError:
+                    pass
+        self._stream = open(self._filename, 'w', encoding='utf-8', buffering=1 << 16)
+        self._size = 0
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush when the buffer is full or on any error."""
+        return len(self.buffer) >= self.capacity or record.levelno >= logging.ERROR
+
+    def flush(self):
+        """Write all buffered records with one write() call."""
+        self.acquire()
+        try:
+            if self.buffer and self._stream is not None:
+                data = ''.join(self.format(record) + '\n' for record in self.buffer)
+                # Size is tracked from what was written (characters, close
+                # enough to bytes here) so no stat is needed per batch
+                if self._size and self._size + len(data) > self._max_bytes:
+                    self._rollover()
+                self._stream.write(data)
+                self._stream.flush()
+                self._size += len(data)
+            self.buffer.clear()
+        finally:
+            self.release()
+
+    def _flush_periodically(self, interval: float):
+        """Keep debug.log reasonably current while the app is idle."""
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def close(self):
+        """Flush what's left and close the file."""
+        self._stop_flushing.set()
+        super().close()
+        self.acquire()
+        try:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+        finally:
+            self.release()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp only once."""
+
+    _cached = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Reuse the previous timestamp while records fall in the same second."""
+        second = int(record.created)
+        cached_second, cached_text = self._cached
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._cached = (second, cached_text)
+        return cached_text
+
 
 class DebugLogger:
     """Enhanced debug logger for OCR and screenshot analysis."""
@@ -20,22 +139,40 @@ class DebugLogger:
         """Initialize debug logger."""
         self.logger = None
         self.screenshots_dir = None
-        self.setup_logging()
-        self.setup_screenshots_dir()
+        self._screenshot_queue = queue.Queue(maxsize=16)
+        self._screenshot_thread = None
+        self._swept_prefixes = set()
+        self._last_digests = {}
+
+        # debug.log and screenshots/ are created on first use rather than at
+        # import, so importing the package doesn't touch the disk
+        self._setup_lock = threading.RLock()
+        self._setup_started = False
+        self._setup_done = False
+
+    def _ensure_setup(self):
+        """Open debug.log and the screenshots directory on first use."""
+        if self._setup_done:
+            return
+        with self._setup_lock:
+            # setup_logging logs through log(), which re-enters here
+            if self._setup_started:
+                return
+            self._setup_started = True
+            self.setup_logging()
+            self.setup_screenshots_dir()
+            self._setup_done = True
     
     def setup_logging(self):
         """Setup detailed logging to debug.log file."""
         try:
-            # Get the directory where the script/exe is located
-            if getattr(sys, 'frozen', False):
-                # Running as exe
-                app_dir = os.path.dirname(sys.executable)
-            else:
-                # Running as script
-                app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            log_file = os.path.join(app_dir, 'debug.log')
+            log_file = os.path.join(_APP_DIR, 'debug.log')
             
+            # Records never use thread/process fields, skip collecting them
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.logMultiprocessing = False
+
             # Create logger
             self.logger = logging.getLogger('coca_debug')
             self.logger.setLevel(logging.DEBUG)
@@ -44,12 +181,14 @@ class DebugLogger:
             for handler in self.logger.handlers[:]:
                 self.logger.removeHandler(handler)
             
-            # Create file handler
-            file_handler = logging.FileHandler(log_file, mode='w', encoding='utf-8')
+            # Buffer records and append them in one write per flush so hot
+            # OCR paths don't hit the disk per line; errors flush immediately
+            file_handler = _BatchedFileHandler(log_file)
             file_handler.setLevel(logging.DEBUG)
+            atexit.register(file_handler.close)
             
             # Create formatter
-            formatter = logging.Formatter(
+            formatter = _CachedTimeFormatter(
                 '%(asctime)s | %(levelname)8s | %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
@@ -66,15 +205,7 @@ class DebugLogger:
     def setup_screenshots_dir(self):
         """Setup screenshots directory."""
         try:
-            # Get the directory where the script/exe is located
-            if getattr(sys, 'frozen', False):
-                # Running as exe
-                app_dir = os.path.dirname(sys.executable)
-            else:
-                # Running as script
-                app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            
-            self.screenshots_dir = os.path.join(app_dir, 'screenshots')
+            self.screenshots_dir = os.path.join(_APP_DIR, 'screenshots')
             
             # Create directory if it doesn't exist
             os.makedirs(self.screenshots_dir, exist_ok=True)
@@ -86,10 +217,20 @@ class DebugLogger:
     
     def log(self, level: str, message: str):
         """Log a message with timestamp."""
+        self._ensure_setup()
         if self.logger:
-            getattr(self.logger, level.lower())(message)
+            lvl = _LEVELS.get(level, logging.INFO)
+            if self.logger.isEnabledFor(lvl):
+                self.logger.log(lvl, message)
         else:
             print(f"[{level}] {message}")
+
+    def is_enabled(self, level: str) -> bool:
+        """Check whether a level would be written, to skip building costly messages."""
+        self._ensure_setup()
+        if self.logger is None:
+            return True
+        return self.logger.isEnabledFor(_LEVELS.get(level, logging.INFO))
     
     def log_screenshot_capture(self, success: bool, area: tuple = None, error: str = None):
         """Log screenshot capture attempt."""
@@ -102,50 +243,104 @@ class DebugLogger:
             self.log("ERROR", f"❌ Screenshot capture failed: {error}")
     
     def save_debug_screenshot(self, image: np.ndarray, prefix: str = "debug") -> Optional[str]:
-        """Save screenshot for debugging (only keeps latest, replaces previous)."""
+        """
+        Queue a screenshot to be saved for debugging (only keeps latest, replaces previous).
+
+        PNG encoding happens on a background thread so it stays off the OCR
+        path; when the queue is full the screenshot is dropped.
+        """
+        self._ensure_setup()
         if self.screenshots_dir is None or image is None:
             return None
 
+        # Concurrent first callers must not start two drainers racing on the same files
+        with self._setup_lock:
+            if self._screenshot_thread is None:
+                self._screenshot_thread = threading.Thread(target=self._drain_screenshots, daemon=True)
+                self._screenshot_thread.start()
+
         try:
-            # Clear existing screenshots with same prefix (remove timestamp versions)
-            for file in os.listdir(self.screenshots_dir):
-                if file.startswith(f"{prefix}_") or file == f"{prefix}.png":
-                    os.remove(os.path.join(self.screenshots_dir, file))
+            # Copy so later in-place edits by the caller can't leak into the file
+            self._screenshot_queue.put_nowait((np.array(image, dtype=np.uint8), prefix))
+        except queue.Full:
+            return None
+
+        return os.path.join(self.screenshots_dir, f"{prefix}.png")
+
+    def _drain_screenshots(self):
+        """Background loop writing queued debug screenshots."""
+        while True:
+            image, prefix = self._screenshot_queue.get()
+            self._write_screenshot(image, prefix)
+
+    def _write_screenshot(self, image: np.ndarray, prefix: str):
+        """Write one debug screenshot, replacing earlier ones with the same prefix."""
+        try:
+            # Idle frames repeat byte for byte; skip re-encoding an unchanged file
+            digest = hashlib.blake2b(repr(image.shape).encode(), digest_size=8)
+            digest.update(np.ascontiguousarray(image))
+            digest = digest.digest()
+            if self._last_digests.get(prefix) == digest:
+                return
+
+            # Clear old timestamped screenshots with this prefix once; after
+            # that the file is simply replaced in place
+            if prefix not in self._swept_prefixes:
+                for file in os.listdir(self.screenshots_dir):
+                    if file.startswith(f"{prefix}_"):
+                        os.remove(os.path.join(self.screenshots_dir, file))
+                self._swept_prefixes.add(prefix)
 
             # Save new screenshot without timestamp - just replace the previous one
             filename = f"{prefix}.png"
             filepath = os.path.join(self.screenshots_dir, filename)
+            temp_path = filepath + '.tmp'
 
-            # Convert numpy array to PIL Image and save
-            if len(image.shape) == 3:
-                pil_image = Image.fromarray(image.astype('uint8'))
+            # Grayscale is written as an 8-bit PNG directly; fast compression
+            # since these files are overwritten on every detection
+            try:
+                import cv2
+            except ImportError:
+                Image.fromarray(image).save(temp_path, format='PNG', compress_level=1)
             else:
-                pil_image = Image.fromarray(image.astype('uint8')).convert('RGB')
+                if image.ndim == 3:
+                    code = cv2.COLOR_RGBA2BGRA if image.shape[2] == 4 else cv2.COLOR_RGB2BGR
+                    image = cv2.cvtColor(image, code)
+                # imencode + tofile rather than imwrite, which can't open
+                # non-ASCII paths on Windows
+                ok, encoded = cv2.imencode('.png', image, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                if not ok:
+                    raise ValueError("PNG encoding failed")
+                encoded.tofile(temp_path)
 
-            pil_image.save(filepath)
+            # Atomic swap, so a viewer never sees a half-written file
+            os.replace(temp_path, filepath)
+            self._last_digests[prefix] = digest
 
             self.log("DEBUG", f"📸 Debug screenshot saved: {filename}")
-            return filepath
 
         except Exception as e:
             self.log("ERROR", f"Failed to save debug screenshot: {e}")
-            return None
     
     def log_ocr_attempt(self, method: str, config: str, text: str, success: bool):
         """Log OCR detection attempt."""
         status = "✅" if success else "❌"
         self.log("INFO", f"{status} OCR Method: {method} | Config: {config}")
-        self.log("DEBUG", f"   Raw OCR Text: '{text.strip()}'" if text else "   No text detected")
+        if self.is_enabled("DEBUG"):
+            self.log("DEBUG", f"   Raw OCR Text: '{text.strip()}'" if text else "   No text detected")
     
     def log_percentage_extraction(self, text: str, percentages: list, method: str):
         """Log percentage extraction results."""
         if percentages:
-            self.log("INFO", f"🔍 {method} found percentages: {percentages}")
-        else:
+            if self.is_enabled("INFO"):
+                self.log("INFO", f"🔍 {method} found percentages: {percentages}")
+        elif self.is_enabled("WARNING"):
             self.log("WARNING", f"❌ {method} found no percentages in: '{text.strip()}'")
     
     def log_image_processing(self, step: str, success: bool, details: str = ""):
         """Log image processing steps."""
+        if not self.is_enabled("DEBUG"):
+            return
         status = "✅" if success else "❌"
         self.log("DEBUG", f"{status} Image Processing - {step}: {details}")
     
@@ -6,14 +6,29 @@ Clean, minimal implementation with precise size control.
 
 import sys
 import os
+import re
 import json
 from PyQt6.QtWidgets import QApplication, QLabel, QWidget, QSystemTrayIcon, QMenu, QVBoxLayout, QHBoxLayout, QPushButton, QDialog, QLineEdit
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRect, QRectF, QPropertyAnimation, QEasingCurve, QPoint
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QAction, QPainter, QPainterPath, QBrush, QColor, QPen, QCursor
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, QMetaObject, pyqtSignal, QRect, QRectF, QPoint
+from PyQt6.QtGui import QFont, QIcon, QAction, QPainter, QPainterPath, QBrush, QColor, QPen, QCursor
 from pynput import keyboard
 import winsound
 import threading
+import queue
 import time
+import io
+import math
+import wave
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+
+# Optional faster JSON codec for the config file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Handle both package and direct execution
 try:
@@ -30,6 +45,278 @@ except ImportError:
     from preferences_dialog import PreferencesDialog
 
 
+def _resolve_asset(name):
+    """
+    Resolve a bundled asset path for both development and PyInstaller builds.
+
+    Args:
+        name: File name inside the assets directory
+
+    Returns:
+        Absolute path to the asset
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, "assets", name)
+
+
+_LOGO_PATH = _resolve_asset("coca_logo.png")
+
+
+def _dumps_config(config):
+    """Serialize a config dict to UTF-8 JSON bytes (2-space indented)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+
+def _loads_config(data):
+    """Parse config JSON bytes into a dict."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Notification tones as (frequency Hz, duration ms, trailing pause s)
+_WARNING_NOTE = (800, 200, 0.3)
+_COMPLETION_NOTES = (
+    (440, 200, 0.08),  # A4 - natural, earthy tone
+    (523, 180, 0.06),  # C5 - gentle rise
+    (659, 220, 0),     # E5 - harmonious completion
+)
+_WAV_RATE = 22050
+
+
+@lru_cache(maxsize=None)
+def _render_wav(notes):
+    """
+    Render a sequence of sine tones, silences included, to an in-memory WAV.
+
+    Args:
+        notes: Tuple of (frequency Hz, duration ms, trailing pause s) tuples
+
+    Returns:
+        16-bit mono PCM WAV file bytes for winsound.PlaySound
+    """
+    samples = array('h')
+    ramp = _WAV_RATE // 200  # 5 ms fade in/out so tones don't click
+    for frequency, duration, pause in notes:
+        count = _WAV_RATE * duration // 1000
+        step = 2 * math.pi * frequency / _WAV_RATE
+        for i in range(count):
+            envelope = min(1.0, i / ramp, (count - i) / ramp)
+            samples.append(int(16000 * envelope * math.sin(step * i)))
+        samples.extend([0] * int(_WAV_RATE * pause))
+    if sys.byteorder == 'big':
+        samples.byteswap()
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(_WAV_RATE)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+# notifications_sent bit layout: one 4-bit group per status, one bit per event
+_NOTIFY_STATUS_SLOT = {
+    "Growing": 0, "Ready": 1, "Flowering": 2, "Running": 3,
+    "stage_completed_growing": 4, "stage_completed_ready": 5, "stage_completed_flowering": 6,
+}
+_NOTIFY_OTHER_SLOT = 7
+_STAGE_COMPLETED_STATUSES = frozenset(
+    status for status in _NOTIFY_STATUS_SLOT if status.startswith("stage_completed_"))
+_NOTIFY_STAGE, _NOTIFY_5MIN, _NOTIFY_1MIN, _NOTIFY_COMPLETED = range(4)
+
+
+def _notify_bit(status, event):
+    """Return the notifications_sent bit for an event of the given status."""
+    return 1 << (_NOTIFY_STATUS_SLOT.get(status, _NOTIFY_OTHER_SLOT) * 4 + event)
+
+
+# Valid trigger word: 2-10 letters a-z (input is lowercased first)
+_TRIGGER_RE = re.compile(r'[a-z]{2,10}')
+
+# Trigger word dialog styling
+_DIALOG_QSS = """
+#container {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #1a3d2e, stop:0.5 #2d5a47, stop:1 #1a3d2e);
+    border: 3px solid #4a7c59;
+    border-radius: 20px;
+}
+
+#title {
+    color: #e8f5e8;
+    font-size: 20px;
+    font-weight: bold;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    margin-bottom: 8px;
+}
+
+#current {
+    color: #b8d4b8;
+    font-size: 14px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    margin-bottom: 15px;
+}
+
+#input {
+    background-color: #2d5a47;
+    border: 2px solid #4a7c59;
+    border-radius: 12px;
+    padding: 15px 20px;
+    color: #e8f5e8;
+    font-size: 16px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-weight: 500;
+    selection-background-color: #6b9b73;
+}
+
+#input:focus {
+    border-color: #6b9b73;
+    background-color: #3a6b54;
+}
+
+#validation {
+    color: #ff8a80;
+    font-size: 12px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    min-height: 25px;
+    margin: 8px 0;
+    font-weight: 500;
+}
+
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3a6b54, stop:1 #2d5a47);
+    border: 2px solid #4a7c59;
+    border-radius: 12px;
+    padding: 12px 25px;
+    color: #e8f5e8;
+    font-size: 14px;
+    font-weight: bold;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4a7c59, stop:1 #3a6b54);
+    border-color: #6b9b73;
+}
+
+QPushButton:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #2d5a47, stop:1 #1a3d2e);
+}
+
+#ok {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #6b9b73, stop:1 #4a7c59);
+    border-color: #6b9b73;
+}
+
+#ok:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #7db87d, stop:1 #6b9b73);
+    border-color: #7db87d;
+}
+
+#ok:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4a7c59, stop:1 #3a6b54);
+}
+
+#ok:disabled {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #333333, stop:1 #2a2a2a);
+    border-color: #444444;
+    color: #666666;
+}
+
+#cancel:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #d32f2f, stop:1 #b71c1c);
+    border-color: #d32f2f;
+}
+"""
+
+# Coca leaf themed tray menu styling, shared by the menu and its submenus
+_MENU_QSS = """
+QMenu {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #1a3d2e, stop:0.5 #2d5a47, stop:1 #1a3d2e);
+    border: 2px solid #4a7c59;
+    border-radius: 12px;
+    padding: 10px 0px;
+    color: #e8f5e8;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-size: 12px;
+    font-weight: 500;
+}
+QMenu::item {
+    padding: 10px 24px;
+    margin: 3px 10px;
+    border-radius: 8px;
+    background-color: transparent;
+}
+QMenu::item:selected {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4a7c59, stop:1 #3a6b54);
+    color: #ffffff;
+}
+QMenu::item:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #6b9b73, stop:1 #4a7c59);
+}
+QMenu::separator {
+    height: 2px;
+    background-color: #4a7c59;
+    margin: 8px 16px;
+    border-radius: 1px;
+}
+"""
+
+# Validation message colour once the input is valid, applied on the label
+# itself so flipping state doesn't re-polish through the dialog's sheet
+_VALIDATION_OK_QSS = "color: #a5d6a7;"
+
+# Pre-formatted "NN.NN %" display strings, indexed by hundredths of a percent
+_PCT_STRINGS = tuple(f"{i / 100:.2f} %" for i in range(10001))
+
+
+def _format_percentage(percentage):
+    """Return the display string for a percentage, clamped to 0-100."""
+    return _PCT_STRINGS[max(0, min(10000, round(percentage * 100)))]
+
+
+# Pre-formatted "MM:SS" countdown strings for up to an hour (every stage
+# is shorter), indexed by seconds left
+_TIME_STRINGS = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(3601))
+
+
+def _format_time_left(time_left):
+    """Return the "MM:SS" display string for a countdown (negative shows 00:00)."""
+    if time_left < 0:
+        return _TIME_STRINGS[0]
+    if time_left <= 3600:
+        return _TIME_STRINGS[time_left]
+    return f"{time_left // 60:02d}:{time_left % 60:02d}"
+
+
+# Digits share one advance width in the overlay font (tabular figures), so
+# measured text widths are cached by the string's shape with digits folded
+_FOLD_DIGITS = str.maketrans('123456789', '000000000')
+
+# Out-cubic easing for the 300 ms reposition slide, sampled once per 10 ms tick
+_SLIDE_STEPS = 30
+_SLIDE_INTERVAL_MS = 10
+_EASING_LUT = tuple(1 - (1 - t / _SLIDE_STEPS) ** 3 for t in range(_SLIDE_STEPS + 1))
+
+
 class ModernTriggerDialog(QDialog):
     """Modern, custom trigger word dialog with real-time validation."""
 
@@ -38,6 +325,14 @@ class ModernTriggerDialog(QDialog):
         self.current_value = current_value
         self.other_trigger = other_trigger
         self.result_value = None
+        self._other_trigger_lower = other_trigger.lower()
+        self._shown_valid = False
+
+        # Validate once typing pauses rather than on every keystroke
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(self.validate_input)
 
         self.setWindowTitle(title)
         self.setFixedSize(450, 320)
@@ -77,7 +372,7 @@ class ModernTriggerDialog(QDialog):
         self.input_field.setObjectName("input")
         self.input_field.setText(self.current_value)
         self.input_field.setPlaceholderText("Enter new trigger word...")
-        self.input_field.textChanged.connect(self.validate_input)
+        self.input_field.textChanged.connect(self._validate_timer.start)
         self.input_field.returnPressed.connect(self.accept_if_valid)
         self.input_field.setMinimumHeight(50)  # Ensure proper height
         container_layout.addWidget(self.input_field)
@@ -119,112 +414,7 @@ class ModernTriggerDialog(QDialog):
 
     def setup_styling(self):
         """Apply modern styling to the dialog."""
-        self.setStyleSheet("""
-            #container {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a3d2e, stop:0.5 #2d5a47, stop:1 #1a3d2e);
-                border: 3px solid #4a7c59;
-                border-radius: 20px;
-            }
-
-            #title {
-                color: #e8f5e8;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                margin-bottom: 8px;
-            }
-
-            #current {
-                color: #b8d4b8;
-                font-size: 14px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                margin-bottom: 15px;
-            }
-
-            #input {
-                background-color: #2d5a47;
-                border: 2px solid #4a7c59;
-                border-radius: 12px;
-                padding: 15px 20px;
-                color: #e8f5e8;
-                font-size: 16px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-                selection-background-color: #6b9b73;
-            }
-
-            #input:focus {
-                border-color: #6b9b73;
-                background-color: #3a6b54;
-            }
-
-            #validation {
-                color: #ff8a80;
-                font-size: 12px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                min-height: 25px;
-                margin: 8px 0;
-                font-weight: 500;
-            }
-
-            #validation[valid="true"] {
-                color: #a5d6a7;
-            }
-
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3a6b54, stop:1 #2d5a47);
-                border: 2px solid #4a7c59;
-                border-radius: 12px;
-                padding: 12px 25px;
-                color: #e8f5e8;
-                font-size: 14px;
-                font-weight: bold;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a7c59, stop:1 #3a6b54);
-                border-color: #6b9b73;
-            }
-
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2d5a47, stop:1 #1a3d2e);
-            }
-
-            #ok {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6b9b73, stop:1 #4a7c59);
-                border-color: #6b9b73;
-            }
-
-            #ok:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #7db87d, stop:1 #6b9b73);
-                border-color: #7db87d;
-            }
-
-            #ok:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a7c59, stop:1 #3a6b54);
-            }
-
-            #ok:disabled {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #333333, stop:1 #2a2a2a);
-                border-color: #444444;
-                color: #666666;
-            }
-
-            #cancel:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #d32f2f, stop:1 #b71c1c);
-                border-color: #d32f2f;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
     def validate_input(self):
         """Real-time validation with visual feedback."""
@@ -235,27 +425,21 @@ class ModernTriggerDialog(QDialog):
             self.show_validation("Enter a trigger word", False)
             return
 
-        # Check length
-        if len(text) < 2:
-            self.show_validation("Must be at least 2 characters", False)
-            return
-
-        if len(text) > 10:
-            self.show_validation("Must be 10 characters or less", False)
-            return
-
-        # Check characters
-        if not text.isalpha():
-            self.show_validation("Only letters allowed (a-z)", False)
-            return
-
-        # Check for spaces
-        if ' ' in text:
-            self.show_validation("No spaces allowed", False)
+        # One regex pass for length and characters; the branches below only
+        # pick the message
+        if not _TRIGGER_RE.fullmatch(text):
+            if len(text) < 2:
+                self.show_validation("Must be at least 2 characters", False)
+            elif len(text) > 10:
+                self.show_validation("Must be 10 characters or less", False)
+            elif ' ' in text:
+                self.show_validation("No spaces allowed", False)
+            else:
+                self.show_validation("Only letters allowed (a-z)", False)
             return
 
         # Check for conflicts
-        if text in self.other_trigger or self.other_trigger in text:
+        if text in self._other_trigger_lower or self._other_trigger_lower in text:
             self.show_validation(f"Conflicts with other trigger '{self.other_trigger}'", False)
             return
 
@@ -270,9 +454,10 @@ class ModernTriggerDialog(QDialog):
     def show_validation(self, message, is_valid):
         """Show validation message with appropriate styling."""
         self.validation_label.setText(message)
-        self.validation_label.setProperty("valid", str(is_valid).lower())
-        self.validation_label.style().unpolish(self.validation_label)
-        self.validation_label.style().polish(self.validation_label)
+        # Restyle only when validity actually flips
+        if is_valid != self._shown_valid:
+            self.validation_label.setStyleSheet(_VALIDATION_OK_QSS if is_valid else "")
+            self._shown_valid = is_valid
         self.ok_btn.setEnabled(is_valid)
 
     def on_apply_clicked(self):
@@ -281,6 +466,11 @@ class ModernTriggerDialog(QDialog):
 
     def accept_if_valid(self):
         """Accept dialog only if input is valid."""
+        # Enter can arrive before the debounced validation has run
+        if self._validate_timer.isActive():
+            self._validate_timer.stop()
+            self.validate_input()
+
         text = self.input_field.text().strip().lower()
 
         if self.ok_btn.isEnabled() and text:
@@ -315,32 +505,43 @@ class RoundedLabel(QLabel):
         self.bg_color = QColor(200, 200, 200, 80)
         self.border_radius = 14  # Reduced from 18 to 14 (20% smaller)
 
+        # Paint resources reused across repaints; the path follows the size
+        self._brush = QBrush(self.bg_color)
+        self._border_pen = QPen(QColor(255, 255, 255, 40))
+        self._border_pen.setWidth(1)
+        self._text_color = QColor(255, 255, 255, 255)
+        self._path = QPainterPath()
+
     def set_background_color(self, color: QColor):
         """Set the background color."""
+        if color == self.bg_color:
+            return
         self.bg_color = color
+        self._brush = QBrush(color)
         self.update()
 
+    def resizeEvent(self, event):
+        """Rebuild the rounded rectangle path for the new size."""
+        super().resizeEvent(event)
+        path = QPainterPath()
+        rect = QRectF(self.rect())  # Convert QRect to QRectF
+        path.addRoundedRect(rect, self.border_radius, self.border_radius)
+        self._path = path
+
     def paintEvent(self, event):
         """Custom paint event for rounded background."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Create rounded rectangle path
-        path = QPainterPath()
-        rect = QRectF(self.rect())  # Convert QRect to QRectF
-        path.addRoundedRect(rect, self.border_radius, self.border_radius)
-
         # Fill background
-        painter.fillPath(path, QBrush(self.bg_color))
+        painter.fillPath(self._path, self._brush)
 
         # Draw border
-        pen = QPen(QColor(255, 255, 255, 40))
-        pen.setWidth(1)
-        painter.setPen(pen)
-        painter.drawPath(path)
+        painter.setPen(self._border_pen)
+        painter.drawPath(self._path)
 
         # Draw text
-        painter.setPen(QColor(255, 255, 255, 255))
+        painter.setPen(self._text_color)
         painter.setFont(self.font())
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.text())
 
@@ -351,12 +552,73 @@ class CocaTimerOverlay(QWidget):
     # Signal for thread-safe UI updates
     timer_update_signal = pyqtSignal(int, str)
 
+    # Trigger words are matched on the keyboard listener thread and handled
+    # on the GUI thread, so the listener callback returns immediately
+    start_triggered = pyqtSignal()
+    reset_triggered = pyqtSignal()
+
+    # Start-trigger OCR result (percentage or None, detected crop or None),
+    # sent from the detection worker to the GUI thread
+    start_detected = pyqtSignal(object, object)
+
+    # Overlay background palette, shared across display updates
+    _COLOR_SEEDING = QColor(76, 175, 80, 120)     # Green for seeding
+    _COLOR_RED = QColor(255, 68, 68, 120)         # Last minute
+    _COLOR_ORANGE = QColor(255, 165, 0, 120)      # Last 5 minutes warning
+    _COLOR_FLOWERING = QColor(156, 39, 176, 120)  # Purple for flowering
+    _COLOR_READY = QColor(33, 150, 243, 120)      # Blue for ready
+    _COLOR_GROWING = QColor(200, 200, 200, 80)    # Light grey while growing
+    _COLOR_FLASH = QColor(255, 255, 255, 150)     # Flash to white
+
+    # Background per stage: one (color, stop_flashing) entry for each band of
+    # time left, <= 60s, <= 300s and longer. Warning bands keep flashing;
+    # statuses not listed (growing) use the None entry
+    _STAGE_THRESHOLDS = (60, 300)
+    _STAGE_COLORS = {
+        "Seeding": ((_COLOR_SEEDING, True),) * 3,
+        "Flowering": ((_COLOR_RED, False), (_COLOR_ORANGE, False), (_COLOR_FLOWERING, True)),
+        "Ready": ((_COLOR_RED, False), (_COLOR_ORANGE, False), (_COLOR_READY, True)),
+        None: ((_COLOR_RED, False), (_COLOR_ORANGE, False), (_COLOR_GROWING, True)),
+    }
+
+    # Window origin per position mode, given (screen, width, height, margin)
+    _POSITIONERS = {
+        "center_top": lambda s, w, h, m: ((s.width() - w) // 2, m),
+        "top_left": lambda s, w, h, m: (m, m),
+        "top_right": lambda s, w, h, m: (s.width() - w - m, m),
+        "bottom_center": lambda s, w, h, m: ((s.width() - w) // 2, s.height() - h - m),
+        "bottom_left": lambda s, w, h, m: (m, s.height() - h - m),
+        "bottom_right": lambda s, w, h, m: (s.width() - w - m, s.height() - h - m),
+    }
+
     def __init__(self):
         super().__init__()
 
         # Initialize position settings first
         self.position_mode = "center_top"  # Default position
-        self.position_animation = None
+        # Reposition slide: a plain timer stepping through _EASING_LUT
+        self.position_animation = QTimer(self)
+        self.position_animation.setInterval(_SLIDE_INTERVAL_MS)
+        self.position_animation.timeout.connect(self._slide_step)
+        self._anim_from = self._anim_to = None
+        self._anim_step = 0
+        self._screen_rect = None  # Cached primary screen geometry
+        self._available_rect = None  # Cached geometry minus the taskbar
+        self._tracked_screen = None
+
+        # Components and state filled in by the setup methods and triggers
+        self.coca_timer = None
+        self.screenshot_tool = None
+        self.area_selector = None
+        self.tray_icon = None
+        self._prefs_dialog = None  # Created on first open, then reused
+        self._pos_actions = None  # Tray menu position actions (None without a tray)
+        self.keyboard_listener = None
+        self._start_trigger_clock = QElapsedTimer()  # Debounce; invalid until first trigger
+        self._reset_trigger_clock = QElapsedTimer()
+        self._selecting_area = False
+        self._starting_timer = False  # Set from trigger until start_detected is handled
+        self._detect_queue = None  # Areas waiting for the detection worker
 
         # Initialize trigger words
         self.trigger_start = "ccc"  # Default start trigger
@@ -365,6 +627,22 @@ class CocaTimerOverlay(QWidget):
         # Configuration - save to the project directory
         project_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_file = os.path.join(project_dir, "coca_config.json")
+
+        # Coalesce config saves: a burst of changes is written once, off the GUI thread
+        self._config_lock = threading.Lock()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_config)
+        self._config_cache = None  # Last config known to be on disk
+
+        # Notification sounds play in order on one long-lived worker
+        self._beep_queue = queue.Queue()
+        threading.Thread(target=self._beep_worker, daemon=True).start()
+        # Render the tones up front so the first warning plays immediately
+        for notes in ((_WARNING_NOTE,), (_WARNING_NOTE,) * 2, _COMPLETION_NOTES):
+            _render_wav(notes)
+
         self.selected_area = None
         self.area_reset_requested = False
 
@@ -373,6 +651,9 @@ class CocaTimerOverlay(QWidget):
         self.planter_type = "basic"  # basic or planter_box
         self.auto_detect_crop = True  # auto-detect crop type from screenshot
 
+        # OCR effort: "fast" or "thorough" (config file only)
+        self.ocr_mode = "fast"
+
         self.load_config()  # Load config before setting up window
 
         self.setup_window()
@@ -382,6 +663,9 @@ class CocaTimerOverlay(QWidget):
 
         # Connect signal for thread-safe updates
         self.timer_update_signal.connect(self.update_display)
+        self.start_triggered.connect(self.handle_start_trigger)
+        self.reset_triggered.connect(self.handle_reset_trigger)
+        self.start_detected.connect(self.start_timer)
 
         # Setup system tray
         self.setup_system_tray()
@@ -414,50 +698,70 @@ class CocaTimerOverlay(QWidget):
 
     def position_window(self, animate=False):
         """Position window based on current position mode."""
-        screen = QApplication.primaryScreen().geometry()
+        screen = self._screen_geometry()
         margin = 20
 
-        # Calculate position based on mode
-        if self.position_mode == "center_top":
-            x = (screen.width() - self.width()) // 2
-            y = margin
-        elif self.position_mode == "top_left":
-            x = margin
-            y = margin
-        elif self.position_mode == "top_right":
-            x = screen.width() - self.width() - margin
-            y = margin
-        elif self.position_mode == "bottom_center":
-            x = (screen.width() - self.width()) // 2
-            y = screen.height() - self.height() - margin
-        elif self.position_mode == "bottom_left":
-            x = margin
-            y = screen.height() - self.height() - margin
-        elif self.position_mode == "bottom_right":
-            x = screen.width() - self.width() - margin
-            y = screen.height() - self.height() - margin
-        else:
-            # Default to center_top
-            x = (screen.width() - self.width()) // 2
-            y = margin
-
-        if animate and hasattr(self, 'position_animation'):
-            # Smooth animation to new position
-            if self.position_animation:
-                self.position_animation.stop()
-
-            self.position_animation = QPropertyAnimation(self, b"pos")
-            self.position_animation.setDuration(300)  # 300ms smooth animation
-            self.position_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self.position_animation.setStartValue(self.pos())
-            self.position_animation.setEndValue(QPoint(x, y))
+        # Calculate position based on mode (unknown modes fall back to center_top)
+        positioner = self._POSITIONERS.get(self.position_mode, self._POSITIONERS["center_top"])
+        x, y = positioner(screen, self.width(), self.height(), margin)
+
+        if animate:
+            # Smooth 300ms slide to the new position
+            self._anim_from, self._anim_to, self._anim_step = self.pos(), QPoint(x, y), 0
             self.position_animation.start()
+        elif self.position_animation.isActive():
+            # A slide is in progress: retarget it rather than jumping
+            self._anim_to = QPoint(x, y)
         else:
             self.move(x, y)
+
+    def _slide_step(self):
+        """Advance the reposition slide by one eased step."""
+        self._anim_step += 1
+        t = _EASING_LUT[self._anim_step]
+        start, end = self._anim_from, self._anim_to
+        self.move(start.x() + round((end.x() - start.x()) * t),
+                  start.y() + round((end.y() - start.y()) * t))
+        if self._anim_step >= _SLIDE_STEPS:
+            self.position_animation.stop()
     
+    def _screen_geometry(self):
+        """
+        Get the primary screen geometry, cached until the screen changes.
+
+        position_window runs on every display update, so the platform
+        lookup is only repeated when the primary screen or its geometry changes.
+        """
+        if self._screen_rect is None:
+            screen = QApplication.primaryScreen()
+            if screen is not self._tracked_screen:
+                screen.geometryChanged.connect(self._on_screen_changed)
+                screen.availableGeometryChanged.connect(self._on_screen_changed)
+                if self._tracked_screen is None:
+                    QApplication.instance().primaryScreenChanged.connect(self._on_screen_changed)
+                self._tracked_screen = screen
+            self._screen_rect = screen.geometry()
+        return self._screen_rect
+
+    def _available_geometry(self):
+        """Get the primary screen's available geometry, cached like _screen_geometry."""
+        if self._available_rect is None:
+            self._screen_geometry()  # Makes sure the primary screen is tracked
+            self._available_rect = self._tracked_screen.availableGeometry()
+        return self._available_rect
+
+    def _on_screen_changed(self, *args):
+        """Drop the cached screen geometry and re-anchor the overlay."""
+        self._screen_rect = None
+        self._available_rect = None
+        self.position_window()
+
     def setup_ui(self):
         """Setup the text label with dynamic formatting."""
         self.label = RoundedLabel(self)
+        self._metrics_font = None  # Font the cached text metrics belong to
+        self._text_height = 0
+        self._text_width_cache = {}
 
         # Font and styling - 20% smaller
         self.font = QFont("Consolas", 9, QFont.Weight.Bold)  # Reduced from 11 to 9
@@ -466,6 +770,10 @@ class CocaTimerOverlay(QWidget):
         # Center-align the text
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter)
 
+        # The label paints its own rounded background and is never styled;
+        # the corners outside the path stay translucent
+        self.label.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
+
         # Initial text with full format
         self.current_time = "38:00"
         self.current_percentage = "0.00 %"
@@ -473,12 +781,23 @@ class CocaTimerOverlay(QWidget):
         self.current_status = "Growing"  # Current stage status
         self.original_time = 38 * 60  # Store original time for percentage calculation
         self.detected_percentage = 0.0  # Store the initially detected percentage
-        self.notifications_sent = set()  # Track which notifications have been sent
+        self.notifications_sent = 0  # Bitmask of sent notifications (see _notify_bit)
+        self._last_render_state = None  # What update_display last put on screen
+        self._last_tick = None  # Last (time_left, status) timer report applied
+        self._base_color = self._COLOR_GROWING  # Stage colour for that report
         self.flash_timer = QTimer()  # Timer for flashing effect
         self.flash_timer.timeout.connect(self.toggle_flash)
         self.is_flashing = False
         self.flash_state = False
-        self.start_time = None  # Track when timer started for smooth percentage
+        self.start_time = None  # Track when timer started for smooth percentage (monotonic)
+        self._pct_slope = 0.0  # Percent gained per second of the current timer
+
+        # The timer thread reports once per second; while growing, the live
+        # percentage is re-rendered from the last report at 10 Hz on the UI side
+        self.last_update = (38 * 60, "---")
+        self.percentage_timer = QTimer()
+        self.percentage_timer.setInterval(100)
+        self.percentage_timer.timeout.connect(self.refresh_percentage)
 
         # Apply initial styling with default timer (38 minutes = 2280 seconds)
         self.update_display(38 * 60, "---")
@@ -487,8 +806,14 @@ class CocaTimerOverlay(QWidget):
         """Initialize core components."""
         self.screenshot_tool = ScreenshotTool()
         self.coca_timer = CocaTimer(self.timer_callback)
+        self.coca_timer.ocr_mode = self.ocr_mode
         self.area_selector = None
 
+        # Screenshot and OCR run on one long-lived worker, so its capture
+        # handle and tesserocr engines are reused across starts
+        self._detect_queue = queue.Queue()
+        threading.Thread(target=self._detect_worker, daemon=True).start()
+
     def timer_callback(self, time_left: int, status: str):
         """Thread-safe callback for timer updates."""
         self.timer_update_signal.emit(time_left, status)
@@ -499,47 +824,27 @@ class CocaTimerOverlay(QWidget):
             print("⚠️ System tray not available")
             return
 
-        # Load coca logo and make it 20% bigger
-        # Handle both development and PyInstaller bundled paths
-        if getattr(sys, 'frozen', False):
-            # PyInstaller bundle
-            base_path = sys._MEIPASS
-            logo_path = os.path.join(base_path, "assets", "coca_logo.png")
-        else:
-            # Development
-            logo_path = os.path.join(os.path.dirname(__file__), "assets", "coca_logo.png")
+        # Load coca logo (path resolved once at import)
+        logo_path = _LOGO_PATH
         if os.path.exists(logo_path):
-            # Load and scale the image 20% bigger
-            pixmap = QPixmap(logo_path)
-            if not pixmap.isNull():
-                # Calculate new size (20% bigger)
-                original_size = pixmap.size()
-                new_width = int(original_size.width() * 1.2)
-                new_height = int(original_size.height() * 1.2)
-
-                # Scale with smooth transformation
-                scaled_pixmap = pixmap.scaled(
-                    new_width, new_height,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                icon = QIcon(scaled_pixmap)
-            else:
+            # File-backed icon: Qt decodes and scales the logo straight to the
+            # tray's icon size when it is first painted, instead of decoding the
+            # full image and smooth-scaling it up front
+            icon = QIcon(logo_path)
+            if not icon.availableSizes():
                 icon = QIcon()
                 print(f"⚠️ Could not load logo from: {logo_path}")
         else:
             # Fallback to default icon if logo not found
             icon = QIcon()
             print(f"⚠️ Logo not found at: {logo_path}")
-            if getattr(sys, 'frozen', False):
-                print(f"🔍 PyInstaller bundle detected. Base path: {sys._MEIPASS}")
-                print(f"🔍 Available files in assets: {os.listdir(os.path.join(sys._MEIPASS, 'assets')) if os.path.exists(os.path.join(sys._MEIPASS, 'assets')) else 'assets folder not found'}")
-            else:
-                print(f"🔍 Development mode. Checking: {os.path.dirname(__file__)}")
-                assets_dir = os.path.join(os.path.dirname(__file__), "assets")
-                print(f"🔍 Assets directory exists: {os.path.exists(assets_dir)}")
-                if os.path.exists(assets_dir):
+            if os.environ.get("COCA_DEBUG"):
+                assets_dir = os.path.dirname(logo_path)
+                print(f"🔍 {'PyInstaller bundle' if getattr(sys, 'frozen', False) else 'Development mode'}. Assets directory: {assets_dir}")
+                if os.path.isdir(assets_dir):
                     print(f"🔍 Files in assets: {os.listdir(assets_dir)}")
+                else:
+                    print("🔍 Assets folder not found")
 
         self.tray_icon = QSystemTrayIcon(icon, self)
 
@@ -552,60 +857,24 @@ class CocaTimerOverlay(QWidget):
         # Connect activation signal for better menu positioning
         self.tray_icon.activated.connect(self.tray_icon_activated)
 
-        # Show tray icon with explicit visibility
+        # Show tray icon; Qt registers it once control returns to the event loop
         self.tray_icon.show()
-        self.tray_icon.setVisible(True)
-
-        # Force tray icon to appear (helps with PyInstaller builds)
-        QApplication.processEvents()
 
         print("✅ System tray initialized")
-        print(f"🔍 Tray icon visible: {self.tray_icon.isVisible()}")
-        print(f"🔍 System tray available: {QSystemTrayIcon.isSystemTrayAvailable()}")
+        if __debug__ and os.environ.get("COCA_DEBUG"):
+            print(f"🔍 Tray icon visible: {self.tray_icon.isVisible()}")
+            print(f"🔍 System tray available: {QSystemTrayIcon.isSystemTrayAvailable()}")
 
     def create_tray_menu(self):
         """Create modern, professional tray menu."""
         menu = QMenu()
 
         # Coca leaf themed menu styling
-        menu.setStyleSheet("""
-            QMenu {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a3d2e, stop:0.5 #2d5a47, stop:1 #1a3d2e);
-                border: 2px solid #4a7c59;
-                border-radius: 12px;
-                padding: 10px 0px;
-                color: #e8f5e8;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QMenu::item {
-                padding: 10px 24px;
-                margin: 3px 10px;
-                border-radius: 8px;
-                background-color: transparent;
-            }
-            QMenu::item:selected {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a7c59, stop:1 #3a6b54);
-                color: #ffffff;
-            }
-            QMenu::item:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6b9b73, stop:1 #4a7c59);
-            }
-            QMenu::separator {
-                height: 2px;
-                background-color: #4a7c59;
-                margin: 8px 16px;
-                border-radius: 1px;
-            }
-        """)
+        menu.setStyleSheet(_MENU_QSS)
 
         # Orientation submenu
         orientation_menu = QMenu("Orientation", menu)
-        orientation_menu.setStyleSheet(menu.styleSheet())
+        orientation_menu.setStyleSheet(_MENU_QSS)
 
         positions = [
             ("Center Top", "center_top"),
@@ -616,29 +885,33 @@ class CocaTimerOverlay(QWidget):
             ("Bottom Right", "bottom_right")
         ]
 
+        self._pos_actions = {}
         for name, mode in positions:
             action = QAction(name, orientation_menu)
             action.setCheckable(True)
             action.setChecked(self.position_mode == mode)
             action.triggered.connect(lambda checked, m=mode: self.set_position_mode(m))
             orientation_menu.addAction(action)
+            self._pos_actions[mode] = action
 
         menu.addMenu(orientation_menu)
         menu.addSeparator()
 
         # Trigger words section
         trigger_menu = QMenu("Trigger Words", menu)
-        trigger_menu.setStyleSheet(menu.styleSheet())
+        trigger_menu.setStyleSheet(_MENU_QSS)
 
         # Start trigger action
         start_trigger_action = QAction(f"Start: '{self.trigger_start}'", trigger_menu)
         start_trigger_action.triggered.connect(self.change_start_trigger)
         trigger_menu.addAction(start_trigger_action)
+        self._start_trigger_action = start_trigger_action
 
         # Reset trigger action
         reset_trigger_action = QAction(f"Reset: '{self.trigger_reset}'", trigger_menu)
         reset_trigger_action.triggered.connect(self.change_reset_trigger)
         trigger_menu.addAction(reset_trigger_action)
+        self._reset_trigger_action = reset_trigger_action
 
         menu.addMenu(trigger_menu)
         menu.addSeparator()
@@ -658,6 +931,15 @@ class CocaTimerOverlay(QWidget):
         self.tray_icon.setContextMenu(menu)
         self.context_menu = menu  # Store reference for positioning
 
+    def update_tray_menu_state(self):
+        """Refresh the tray menu's checkmarks and trigger labels in place."""
+        if self._pos_actions is None:
+            return  # No system tray, so no menu was built
+        for mode, action in self._pos_actions.items():
+            action.setChecked(mode == self.position_mode)
+        self._start_trigger_action.setText(f"Start: '{self.trigger_start}'")
+        self._reset_trigger_action.setText(f"Reset: '{self.trigger_reset}'")
+
     def tray_icon_activated(self, reason):
         """Handle tray icon activation with proper menu positioning."""
         if reason == QSystemTrayIcon.ActivationReason.Context:
@@ -665,7 +947,7 @@ class CocaTimerOverlay(QWidget):
             tray_geometry = self.tray_icon.geometry()
             menu = self.context_menu
             menu_size = menu.sizeHint()
-            screen_geometry = QApplication.primaryScreen().availableGeometry()
+            screen_geometry = self._available_geometry()
 
             # Position menu above the tray icon
             if tray_geometry.isValid():
@@ -678,15 +960,9 @@ class CocaTimerOverlay(QWidget):
                 x = cursor_pos.x() - menu_size.width() // 2
                 y = cursor_pos.y() - menu_size.height() - 10
 
-            # Ensure menu stays within screen bounds
-            if x + menu_size.width() > screen_geometry.right():
-                x = screen_geometry.right() - menu_size.width()
-            if x < screen_geometry.left():
-                x = screen_geometry.left()
-            if y < screen_geometry.top():
-                y = screen_geometry.top()
-            if y + menu_size.height() > screen_geometry.bottom():
-                y = screen_geometry.bottom() - menu_size.height()
+            # Ensure menu stays within screen bounds (left and bottom edges win)
+            x = max(screen_geometry.left(), min(x, screen_geometry.right() - menu_size.width()))
+            y = min(max(y, screen_geometry.top()), screen_geometry.bottom() - menu_size.height())
 
             menu.popup(QPoint(x, y))
 
@@ -698,7 +974,7 @@ class CocaTimerOverlay(QWidget):
             self.save_config()  # Save position preference
 
             # Update menu checkmarks
-            self.create_tray_menu()
+            self.update_tray_menu_state()
 
             print(f"🎯 Position changed to: {mode}")
 
@@ -715,7 +991,7 @@ class CocaTimerOverlay(QWidget):
             self.trigger_start = dialog.result_value
             self.save_config()
             self.restart_keyboard_listener()  # Restart listener with new triggers
-            self.create_tray_menu()  # Refresh menu
+            self.update_tray_menu_state()  # Refresh menu
             print(f"✅ Start trigger changed to: '{self.trigger_start}'")
 
     def change_reset_trigger(self):
@@ -731,7 +1007,7 @@ class CocaTimerOverlay(QWidget):
             self.trigger_reset = dialog.result_value
             self.save_config()
             self.restart_keyboard_listener()  # Restart listener with new triggers
-            self.create_tray_menu()  # Refresh menu
+            self.update_tray_menu_state()  # Refresh menu
             print(f"✅ Reset trigger changed to: '{self.trigger_reset}'")
 
 
@@ -739,43 +1015,45 @@ class CocaTimerOverlay(QWidget):
     def exit_application(self):
         """Clean exit of the application."""
         print("👋 COCA Timer exiting...")
-        if hasattr(self, 'coca_timer'):
-            self.coca_timer.stop()
-        if hasattr(self, 'tray_icon'):
+        if self._save_timer.isActive():
+            # Write the pending change before the event loop stops
+            self._save_timer.stop()
+            self._flush_config(background=False)
+        if self.coca_timer is not None:
+            self.coca_timer.close()
+        if self.screenshot_tool is not None:
+            self.screenshot_tool.close()
+        self._beep_queue.put(None)  # Let the sound worker finish
+        if self._detect_queue is not None:
+            self._detect_queue.put(None)  # And the detection worker
+        if self.tray_icon is not None:
             self.tray_icon.hide()
         QApplication.quit()
     
     def setup_keyboard(self):
         """Setup global keyboard listener."""
-        self.key_sequence = []
-        
+        self.key_sequence = ''
+
+        # Triggers only change through restart_keyboard_listener, which calls
+        # back into here; longest first so longer matches win over conflicts
+        max_trigger_len = max(len(self.trigger_start), len(self.trigger_reset))
+        triggers_to_check = sorted([
+            (self.trigger_start, "start", self.start_triggered.emit),
+            (self.trigger_reset, "reset", self.reset_triggered.emit)
+        ], key=lambda x: len(x[0]), reverse=True)
+
         def on_key_press(key):
             try:
                 if hasattr(key, 'char') and key.char:
-                    self.key_sequence.append(key.char.lower())
-                    
                     # Keep only the necessary characters based on longest trigger word
-                    max_trigger_len = max(len(self.trigger_start), len(self.trigger_reset))
-                    if len(self.key_sequence) > max_trigger_len:
-                        self.key_sequence = self.key_sequence[-max_trigger_len:]
-                    
-                    # Check for trigger sequences (prioritize longer matches to avoid conflicts)
-                    triggers_to_check = [
-                        (self.trigger_start, "start", self.handle_start_trigger),
-                        (self.trigger_reset, "reset", self.handle_reset_trigger)
-                    ]
-
-                    # Sort by length (longest first) to prioritize longer matches
-                    triggers_to_check.sort(key=lambda x: len(x[0]), reverse=True)
+                    self.key_sequence = (self.key_sequence + key.char.lower())[-max_trigger_len:]
 
                     for trigger_word, trigger_type, handler in triggers_to_check:
-                        if len(self.key_sequence) >= len(trigger_word):
-                            sequence = ''.join(self.key_sequence[-len(trigger_word):])
-                            if sequence == trigger_word:
-                                print(f"🎯 {trigger_type.title()} trigger '{trigger_word}' detected!")
-                                handler()
-                                self.key_sequence = []
-                                return
+                        if self.key_sequence.endswith(trigger_word):
+                            print(f"🎯 {trigger_type.title()} trigger '{trigger_word}' detected!")
+                            handler()
+                            self.key_sequence = ''
+                            return
             except Exception as e:
                 print(f"⚠️ Keyboard error: {e}")
         
@@ -787,7 +1065,7 @@ class CocaTimerOverlay(QWidget):
         """Restart keyboard listener with updated trigger words."""
         try:
             # Stop existing listener
-            if hasattr(self, 'keyboard_listener') and self.keyboard_listener:
+            if self.keyboard_listener:
                 self.keyboard_listener.stop()
                 print("🔄 Stopped old keyboard listener")
 
@@ -800,63 +1078,157 @@ class CocaTimerOverlay(QWidget):
     def update_text(self):
         """Update the display text with consistent formatting."""
         text = f"{self.current_crop_display}: {self.current_time} | {self.current_percentage} | {self.current_status}"
+        if text == self.label.text():
+            return
+        # setText only invalidates the label's own rect
         self.label.setText(text)
 
-        # Force the label to calculate its size with current styling
-        self.label.adjustSize()
-
-        # Calculate size based on text metrics for perfect fit
-        font_metrics = self.label.fontMetrics()
-        text_width = font_metrics.horizontalAdvance(text)
-        text_height = font_metrics.height()
+        # Calculate size based on text metrics for perfect fit; metrics are
+        # cached per font and widths per text shape, since only digits tick
+        font = self.label.font()
+        if font != self._metrics_font:
+            self._metrics_font = font
+            self._text_height = self.label.fontMetrics().height()
+            self._text_width_cache = {}
+        shape = text.translate(_FOLD_DIGITS)
+        text_width = self._text_width_cache.get(shape)
+        if text_width is None:
+            text_width = self.label.fontMetrics().horizontalAdvance(text)
+            self._text_width_cache[shape] = text_width
+        text_height = self._text_height
 
         # Add padding for the rounded background - 20% smaller
         window_width = max(text_width + 16, 96)    # Reduced padding (20→16, 120→96)
         window_height = max(text_height + 10, 28)  # Reduced padding (12→10, 35→28)
 
-        self.setFixedSize(window_width, window_height)
-        self.label.resize(window_width, window_height)
-        self.position_window()  # Re-center after resize
+        # Most ticks only change digits; resize and re-center only when the
+        # fitted size actually changes
+        if window_width != self.width() or window_height != self.height():
+            self.setFixedSize(window_width, window_height)
+            self.label.resize(window_width, window_height)
+            self.position_window()  # Re-center after resize
 
     def toggle_flash(self):
         """Toggle flash state for flashing effect."""
         self.flash_state = not self.flash_state
-        # Force a display update to show the flash
-        if hasattr(self, 'current_time'):
-            self.update_text()
+        # Nothing to redraw while the overlay is hidden or fully covered
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
+        # Timer reports arrive only once a second, so apply the flash colour
+        # here; the next report must re-apply its colour even if nothing else changed
+        self.label.set_background_color(self._COLOR_FLASH if self.flash_state else self._base_color)
+        self._last_render_state = None
+
+    def hideEvent(self, event):
+        """Pause the flash timer while the overlay is hidden."""
+        super().hideEvent(event)
+        self.flash_timer.stop()
+
+    def showEvent(self, event):
+        """Resume flashing when the overlay is shown again."""
+        super().showEvent(event)
+        if self.is_flashing and not self.flash_timer.isActive():
+            self.flash_timer.start(1200)
+
+    def _beep_worker(self):
+        """Play queued WAV sounds in order until a None sentinel."""
+        while True:
+            sound = self._beep_queue.get()
+            if sound is None:
+                break
+            try:
+                # One PlaySound per notification; blocks only this worker
+                winsound.PlaySound(sound, winsound.SND_MEMORY)
+            except Exception as e:
+                print(f"⚠️ Error playing sound: {e}")
 
     def play_beep(self, count: int):
-        """Play beep sound in a separate thread."""
-        def beep_thread():
-            for _ in range(count):
-                winsound.Beep(800, 200)  # 800Hz for 200ms
-                if count > 1:
-                    threading.Event().wait(0.3)  # Short pause between beeps
-
-        threading.Thread(target=beep_thread, daemon=True).start()
+        """Queue warning beeps (800Hz for 200ms each) on the sound worker."""
+        self._beep_queue.put(_render_wav((_WARNING_NOTE,) * count))
 
     def play_completion_sound(self):
         """Play a nature-inspired completion sound that fits the coca leaf theme."""
-        def completion_thread():
-            try:
-                # Nature-inspired completion melody - like wind through leaves
-                winsound.Beep(440, 200)  # A4 - natural, earthy tone
-                threading.Event().wait(0.08)
-                winsound.Beep(523, 180)  # C5 - gentle rise
-                threading.Event().wait(0.06)
-                winsound.Beep(659, 220)  # E5 - harmonious completion
-            except Exception as e:
-                print(f"⚠️ Error playing completion sound: {e}")
+        # Nature-inspired completion melody - like wind through leaves
+        self._beep_queue.put(_render_wav(_COMPLETION_NOTES))
 
-        threading.Thread(target=completion_thread, daemon=True).start()
+    def refresh_percentage(self):
+        """Re-render the live growing percentage between timer ticks."""
+        if self.coca_timer.running:
+            self.update_display(*self.last_update)
+        else:
+            self.percentage_timer.stop()
 
     def update_display(self, time_left: int, status: str = ""):
         """Update the timer display with multi-stage lifecycle support."""
+        # Stage completion signals carry no display state, just the sound;
+        # a timed stage never reports time_left == 0 itself
+        if status in _STAGE_COMPLETED_STATUSES:
+            bit = _notify_bit(status, _NOTIFY_COMPLETED)
+            if not self.notifications_sent & bit:
+                self.notifications_sent |= bit
+                self.play_completion_sound()
+                self.stop_flashing()
+                print(f"🔊 {status[len('stage_completed_'):].title()} stage completed - playing completion sound")
+            return
+
+        # Keep the smooth percentage refresh running only while growing
+        self.last_update = (time_left, status)
+        if status == "Growing":
+            if not self.percentage_timer.isActive():
+                self.percentage_timer.start()
+        else:
+            self.percentage_timer.stop()
+
+        # The 10 Hz percentage refresh repeats the last timer report; only
+        # the live percentage can change until the timer reports again
+        if (time_left, status) != self._last_tick:
+            self._last_tick = (time_left, status)
+            self._apply_timer_report(time_left, status)
+
+        # Calculate live percentage based on time remaining during growing stage
+        if status not in ("Seeding", "Ready", "Flowering"):
+            if self.original_time > 0 and status == "Growing":
+                # Use real time for ultra-smooth percentage progression; the
+                # rate (from detected to 100% over the timer) is fixed per timer
+                if self.start_time is None:
+                    self.start_time = time.monotonic()
+                    self._pct_slope = (100.0 - self.detected_percentage) / self.original_time
+
+                # Progress through the remaining percentage using real elapsed time
+                real_time_elapsed = min(time.monotonic() - self.start_time, self.original_time)
+                current_percentage = self.detected_percentage + self._pct_slope * real_time_elapsed
+
+                self.current_percentage = _format_percentage(current_percentage)
+            else:
+                self.current_percentage = _format_percentage(self.detected_percentage)
+
+        # Apply flashing effect if active
+        if self.is_flashing and self.flash_state:
+            bg_color = self._COLOR_FLASH  # Flash to white
+        else:
+            bg_color = self._base_color
 
-        # Update current status (filter out stage completion signals)
-        if status.startswith("stage_completed_"):
-            # Don't update display status for completion signals, just handle sound
+        # Nothing visible changed since the last tick: skip the Qt calls
+        render_state = (self.current_crop_display, self.current_time,
+                        self.current_percentage, self.current_status, bg_color)
+        if render_state == self._last_render_state and self.isVisible():
             return
+        self._last_render_state = render_state
+
+        # Set the background color on our custom rounded label (repaints
+        # only when the colour changes)
+        self.label.set_background_color(bg_color)
+        self.update_text()
+
+        # Ensure overlay is visible and on top
+        if not self.isVisible():
+            self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def _apply_timer_report(self, time_left: int, status: str):
+        """Update status, countdown, notifications and stage colour for a new timer report."""
+        # Update current status
         self.current_status = status if status else "Growing"
 
         # Handle different stages
@@ -866,128 +1238,41 @@ class CocaTimerOverlay(QWidget):
             self.current_percentage = "100.00 %"
         elif status in ["Ready", "Flowering"]:
             # Ready and Flowering stages show countdown timer
-            if time_left >= 0:
-                minutes = time_left // 60
-                seconds = time_left % 60
-                self.current_time = f"{minutes:02d}:{seconds:02d}"
-            else:
-                self.current_time = "00:00"
+            self.current_time = _format_time_left(time_left)
 
             # For non-growing stages, show 100% (plant is fully grown)
             self.current_percentage = "100.00 %"
         else:
             # Growing stage - normal timer with percentage progression
-            minutes = time_left // 60
-            seconds = time_left % 60
-            self.current_time = f"{minutes:02d}:{seconds:02d}"
-
-            # Calculate live percentage based on time remaining during growing stage
-            if hasattr(self, 'original_time') and self.original_time > 0 and status == "Growing":
-                # Use real time for ultra-smooth percentage progression
-                if self.start_time is None:
-                    self.start_time = time.time()
-
-                # Calculate actual time elapsed since timer started
-                current_time = time.time()
-                real_time_elapsed = current_time - self.start_time
-
-                # Calculate the percentage range we need to cover (from detected to 100%)
-                percentage_range = 100.0 - self.detected_percentage
-
-                # Calculate progress through the remaining percentage using real time
-                if self.original_time > 0:
-                    progress_ratio = min(real_time_elapsed / self.original_time, 1.0)
-                    percentage_increase = percentage_range * progress_ratio
-                    current_percentage = self.detected_percentage + percentage_increase
-                else:
-                    current_percentage = self.detected_percentage
-
-                self.current_percentage = f"{current_percentage:.2f} %"
-            else:
-                self.current_percentage = f"{self.detected_percentage:.2f} %"
-
-        # Handle stage completion sounds
-        if status.startswith("stage_completed_"):
-            stage_name = status.replace("stage_completed_", "")
-            if status not in self.notifications_sent:
-                self.notifications_sent.add(status)
-                self.play_completion_sound()
-                self.stop_flashing()
-                print(f"🔊 {stage_name.title()} stage completed - playing completion sound")
-            return  # Don't process further for stage completion signals
+            self.current_time = _format_time_left(time_left)
 
         # Handle notifications and flashing (only for timed stages)
         if status != "Seeding" and time_left >= 0:
             # Check if we just entered a new stage and stop flashing
-            stage_key = f"{status}_stage"
-            if stage_key not in self.notifications_sent:
-                self.notifications_sent.add(stage_key)
+            stage_bit = _notify_bit(status, _NOTIFY_STAGE)
+            if not self.notifications_sent & stage_bit:
+                self.notifications_sent |= stage_bit
                 self.stop_flashing()  # Stop flashing when entering new stage
 
-            if time_left == 300 and f"{status}_5min" not in self.notifications_sent:  # 5 minutes
-                self.notifications_sent.add(f"{status}_5min")
+            if time_left == 300 and not self.notifications_sent & _notify_bit(status, _NOTIFY_5MIN):  # 5 minutes
+                self.notifications_sent |= _notify_bit(status, _NOTIFY_5MIN)
                 self.play_beep(1)
                 self.start_flashing()
-            elif time_left == 60 and f"{status}_1min" not in self.notifications_sent:  # 1 minute
-                self.notifications_sent.add(f"{status}_1min")
+            elif time_left == 60 and not self.notifications_sent & _notify_bit(status, _NOTIFY_1MIN):  # 1 minute
+                self.notifications_sent |= _notify_bit(status, _NOTIFY_1MIN)
                 self.play_beep(2)
                 self.start_flashing()
-            elif time_left == 0 and f"{status}_completed" not in self.notifications_sent:  # Stage completed
-                self.notifications_sent.add(f"{status}_completed")
+            elif time_left == 0 and not self.notifications_sent & _notify_bit(status, _NOTIFY_COMPLETED):  # Stage completed
+                self.notifications_sent |= _notify_bit(status, _NOTIFY_COMPLETED)
                 self.play_completion_sound()
                 self.stop_flashing()
 
-        # Update background colors based on stage and time left
-        if status == "Seeding":
-            # Seeding stage - special green color to indicate completion
-            base_color = QColor(76, 175, 80, 120)  # Green for seeding
+        # Update background colors based on stage and time left; flashing
+        # only continues inside the warning periods
+        bands = self._STAGE_COLORS.get(status, self._STAGE_COLORS[None])
+        self._base_color, stop_flashing = bands[bisect_left(self._STAGE_THRESHOLDS, time_left)]
+        if stop_flashing:
             self.stop_flashing()
-        elif status == "Flowering":
-            # Flowering stage - purple/pink color, only flash in warning periods
-            if time_left <= 60:  # Last minute - red background with flashing
-                base_color = QColor(255, 68, 68, 120)
-            elif time_left <= 300:  # Last 5 minutes - orange warning
-                base_color = QColor(255, 165, 0, 120)
-            else:  # Normal flowering - purple background, no flashing
-                base_color = QColor(156, 39, 176, 120)
-                if time_left > 300:  # Stop flashing if not in warning period
-                    self.stop_flashing()
-        elif status == "Ready":
-            # Ready stage - blue color, only flash in warning periods
-            if time_left <= 60:  # Last minute - red background with flashing
-                base_color = QColor(255, 68, 68, 120)
-            elif time_left <= 300:  # Last 5 minutes - orange warning
-                base_color = QColor(255, 165, 0, 120)
-            else:  # Normal ready - blue background, no flashing
-                base_color = QColor(33, 150, 243, 120)
-                if time_left > 300:  # Stop flashing if not in warning period
-                    self.stop_flashing()
-        elif time_left <= 60:  # Last minute - red background
-            base_color = QColor(255, 68, 68, 120)
-        elif time_left <= 300:  # Last 5 minutes - orange-yellow warning background
-            base_color = QColor(255, 165, 0, 120)  # Orange-yellow warning color
-        else:  # Normal growing - light grey background
-            base_color = QColor(200, 200, 200, 80)
-            self.stop_flashing()  # Stop flashing when not in warning time
-
-        # Apply flashing effect if active
-        if self.is_flashing and self.flash_state:
-            bg_color = QColor(255, 255, 255, 150)  # Flash to white
-        else:
-            bg_color = base_color
-
-        # Set the background color on our custom rounded label
-        self.label.set_background_color(bg_color)
-
-        # Remove any stylesheet to let custom painting handle everything
-        self.label.setStyleSheet("")
-        self.update_text()
-
-        # Ensure overlay is visible and on top
-        if not self.isVisible():
-            self.show()
-        self.raise_()
-        self.activateWindow()
 
     def start_flashing(self):
         """Start the elegant, slow flashing effect."""
@@ -1003,34 +1288,39 @@ class CocaTimerOverlay(QWidget):
             self.flash_timer.stop()
 
     def handle_start_trigger(self):
-        """Handle start trigger - start timer or area selection."""
+        """Handle start trigger (GUI thread) - start timer or area selection."""
         print(f"🎯 '{self.trigger_start}' triggered")
 
         # Prevent rapid trigger firing
-        if hasattr(self, '_last_start_trigger') and time.time() - self._last_start_trigger < 1.0:
+        if self._start_trigger_clock.isValid() and self._start_trigger_clock.elapsed() < 1000:
             print("⚠️ Start trigger fired too quickly - ignoring")
             return
-        self._last_start_trigger = time.time()
+        self._start_trigger_clock.start()
 
         if not self.selected_area or self.area_reset_requested:
             print("📍 Selecting area...")
             self.select_area()
+        elif self._starting_timer:
+            # Prevent multiple simultaneous timer starts
+            print("⚠️ Timer start already in progress...")
         else:
-            self.start_timer()
+            # Screenshot and OCR take a while; keep them off the GUI thread
+            self._starting_timer = True
+            self._detect_queue.put(self.selected_area)
 
     def handle_reset_trigger(self):
-        """Handle reset trigger - reset area selection."""
+        """Handle reset trigger (GUI thread) - reset area selection."""
         print(f"🔄 '{self.trigger_reset}' triggered - area reset requested")
 
         # Prevent rapid trigger firing
-        if hasattr(self, '_last_reset_trigger') and time.time() - self._last_reset_trigger < 1.0:
+        if self._reset_trigger_clock.isValid() and self._reset_trigger_clock.elapsed() < 1000:
             print("⚠️ Reset trigger fired too quickly - ignoring")
             return
-        self._last_reset_trigger = time.time()
+        self._reset_trigger_clock.start()
 
         # Stop any running timer
         try:
-            if hasattr(self, 'coca_timer') and self.coca_timer.running:
+            if self.coca_timer is not None and self.coca_timer.running:
                 self.coca_timer.stop()
                 print("⏹️ Timer stopped for area reset")
         except Exception as e:
@@ -1048,7 +1338,7 @@ class CocaTimerOverlay(QWidget):
     def _cleanup_area_selector(self):
         """Force cleanup of area selector to prevent crashes."""
         try:
-            if hasattr(self, 'area_selector') and self.area_selector:
+            if self.area_selector:
                 print("🧹 Cleaning up existing area selector...")
                 self.area_selector.cleanup_and_close()
                 self.area_selector = None
@@ -1060,7 +1350,7 @@ class CocaTimerOverlay(QWidget):
     def select_area(self):
         """Open area selector for OCR region - robust version."""
         # Prevent multiple simultaneous area selections
-        if hasattr(self, '_selecting_area') and self._selecting_area:
+        if self._selecting_area:
             print("⚠️ Area selection already in progress...")
             return
 
@@ -1070,19 +1360,7 @@ class CocaTimerOverlay(QWidget):
             print("📸 Preparing area selection...")
 
             # Take screenshot with retries
-            screenshot = None
-            for attempt in range(3):
-                try:
-                    screenshot = self.screenshot_tool.capture_full_screen()
-                    if screenshot is not None:
-                        print(f"✅ Screenshot for area selection captured (attempt {attempt + 1})")
-                        break
-                    else:
-                        print(f"⚠️ Screenshot attempt {attempt + 1} failed - retrying...")
-                        time.sleep(0.2)
-                except Exception as e:
-                    print(f"⚠️ Screenshot attempt {attempt + 1} error: {e}")
-                    time.sleep(0.2)
+            screenshot = self._capture_with_retries(self.screenshot_tool.capture_full_screen)
 
             if screenshot is None:
                 print("❌ Failed to capture screenshot for area selection after all attempts")
@@ -1092,22 +1370,27 @@ class CocaTimerOverlay(QWidget):
             # Hide main window temporarily
             self.hide()
 
+            # The selector callbacks run on its Tk thread; widgets may only be
+            # shown from the GUI thread
+            def show_overlay():
+                QMetaObject.invokeMethod(self, "show", Qt.ConnectionType.QueuedConnection)
+
             def on_area_selected(area):
                 try:
                     self.selected_area = area
                     self.area_reset_requested = False
                     self.save_config()
-                    self.show()
+                    show_overlay()
                     print(f"✅ COCA area selected: {area}")
                 except Exception as e:
                     print(f"⚠️ Error saving selected area: {e}")
-                    self.show()
+                    show_overlay()
                 finally:
                     self._selecting_area = False
 
             def on_cancelled():
                 try:
-                    self.show()
+                    show_overlay()
                     print("❌ Area selection cancelled")
                 except Exception as e:
                     print(f"⚠️ Error handling cancelled selection: {e}")
@@ -1125,7 +1408,7 @@ class CocaTimerOverlay(QWidget):
                     self.area_selector.show()
                 except Exception as e:
                     print(f"⚠️ Error running area selector: {e}")
-                    self.show()  # Show main window if area selector fails
+                    show_overlay()  # Show main window if area selector fails
                     self._selecting_area = False
 
             selector_thread = threading.Thread(target=run_area_selector, daemon=True)
@@ -1137,74 +1420,99 @@ class CocaTimerOverlay(QWidget):
             self.show()
             self._selecting_area = False
     
-    def start_timer(self):
-        """Start the COCA timer with OCR detection - robust version."""
-        if not self.selected_area:
-            print("❌ No area selected - use reset trigger then start trigger")
-            return
+    def _capture_with_retries(self, capture, *args, attempts=3, delay=0.05):
+        """
+        Take a screenshot, retrying with exponential backoff.
+
+        Args:
+            capture: Screenshot function returning an image or None
+            *args: Arguments passed to capture
+            attempts: Maximum number of tries
+            delay: Pause before the first retry in seconds, doubled after each
+
+        Returns:
+            The captured image, or None if every attempt failed
+        """
+        for attempt in range(attempts):
+            try:
+                screenshot = capture(*args)
+                if screenshot is not None:
+                    print(f"✅ Screenshot captured (attempt {attempt + 1})")
+                    return screenshot
+                print(f"⚠️ Screenshot attempt {attempt + 1} failed - retrying...")
+            except Exception as e:
+                print(f"⚠️ Screenshot attempt {attempt + 1} error: {e}")
+            if attempt + 1 < attempts:
+                time.sleep(delay * (1 << attempt))
+        return None
+
+    def _detect_worker(self):
+        """Capture and OCR queued areas until a None sentinel."""
+        while True:
+            area = self._detect_queue.get()
+            if area is None:
+                break
+            percentage, detected_crop = None, None
+            try:
+                percentage, detected_crop = self.detect_start_percentage(area)
+            except Exception as e:
+                print(f"⚠️ Critical error in start detection: {e}")
+            finally:
+                # Timer state is only touched on the GUI thread
+                self.start_detected.emit(percentage, detected_crop)
 
-        # Prevent multiple simultaneous timer starts
-        if hasattr(self, '_starting_timer') and self._starting_timer:
-            print("⚠️ Timer start already in progress...")
-            return
+    def detect_start_percentage(self, area):
+        """
+        Capture the selected area and read its growth percentage (worker thread).
 
-        self._starting_timer = True
+        Args:
+            area: Screen area as (x, y, width, height)
 
-        try:
-            print("📸 Capturing screenshot...")
-            screenshot = None
+        Returns:
+            Tuple of (percentage, crop_type); either may be None
+        """
+        print("📸 Capturing screenshot...")
 
-            # Robust screenshot capture with retries
-            for attempt in range(3):
-                try:
-                    screenshot = self.screenshot_tool.capture_area(self.selected_area)
-                    if screenshot is not None:
-                        print(f"✅ Screenshot captured (attempt {attempt + 1})")
-                        break
-                    else:
-                        print(f"⚠️ Screenshot attempt {attempt + 1} failed - retrying...")
-                        time.sleep(0.1)  # Brief pause before retry
-                except Exception as e:
-                    print(f"⚠️ Screenshot attempt {attempt + 1} error: {e}")
-                    time.sleep(0.1)
+        # Robust screenshot capture with retries
+        screenshot = self._capture_with_retries(self.screenshot_tool.capture_area, area)
 
-            if screenshot is None:
-                print("❌ All screenshot attempts failed - using default timer")
-                self._start_default_timer()
-                return
+        if screenshot is None:
+            print("❌ All screenshot attempts failed - using default timer")
+            return None, None
 
-            print("🔍 Running OCR detection...")
-            percentage = None
-            detected_crop = None
+        print("🔍 Running OCR detection...")
 
-            # Robust OCR with error handling
-            try:
-                if self.auto_detect_crop:
-                    # Use enhanced detection that also extracts crop type
-                    percentage, detected_crop = self.coca_timer.detect_percentage_and_crop(screenshot)
-
-                    # If crop type was detected, use it to override manual setting
-                    if detected_crop:
-                        original_crop = self.crop_type
-                        self.crop_type = detected_crop
-                        # Update display name for floating UI
-                        self.current_crop_display = "Cannabis" if detected_crop == "marijuana" else "Coca"
-                        print(f"🌿 Auto-detected crop type: {detected_crop} (was: {original_crop})")
-                    else:
-                        # Use manual setting and update display name
-                        self.current_crop_display = "Cannabis" if self.crop_type == "marijuana" else "Coca"
-                        print(f"🌿 No crop type detected, using manual setting: {self.crop_type}")
-                else:
-                    # Use standard percentage detection only
-                    percentage = self.coca_timer.detect_percentage(screenshot)
-                    # Update display name for manual setting
-                    self.current_crop_display = "Cannabis" if self.crop_type == "marijuana" else "Coca"
-                    print(f"🌿 Using manual crop setting: {self.crop_type}")
+        # Robust OCR with error handling
+        try:
+            if self.auto_detect_crop:
+                # Use enhanced detection that also extracts crop type
+                return self.coca_timer.detect_percentage_and_crop(screenshot)
+            # Use standard percentage detection only
+            return self.coca_timer.detect_percentage(screenshot), None
+        except Exception as e:
+            print(f"⚠️ OCR detection failed: {e}")
+            return None, None
 
-            except Exception as e:
-                print(f"⚠️ OCR detection failed: {e}")
-                percentage = None
-                detected_crop = None
+    def start_timer(self, percentage, detected_crop):
+        """
+        Start the COCA timer from a start-trigger detection (GUI thread).
+
+        Args:
+            percentage: Detected growth percentage, or None to use the default timer
+            detected_crop: Crop type read from the capture, or None
+        """
+        try:
+            if self.auto_detect_crop and detected_crop:
+                # If crop type was detected, use it to override manual setting
+                original_crop = self.crop_type
+                self.crop_type = detected_crop
+                print(f"🌿 Auto-detected crop type: {detected_crop} (was: {original_crop})")
+            elif self.auto_detect_crop:
+                print(f"🌿 No crop type detected, using manual setting: {self.crop_type}")
+            else:
+                print(f"🌿 Using manual crop setting: {self.crop_type}")
+            # Update display name for floating UI
+            self.current_crop_display = "Cannabis" if self.crop_type == "marijuana" else "Coca"
 
             if percentage is not None:
                 timer_seconds = self.get_timer_duration(percentage)
@@ -1222,7 +1530,8 @@ class CocaTimerOverlay(QWidget):
                 # Start timer with error handling
                 try:
                     # Reset notifications for new timer
-                    self.notifications_sent.clear()
+                    self.notifications_sent = 0
+                    self._last_tick = None
                     self.stop_flashing()  # Stop any existing flashing
                     self.coca_timer.start(timer_seconds, self.crop_type, self.planter_type)
                 except Exception as e:
@@ -1246,7 +1555,8 @@ class CocaTimerOverlay(QWidget):
             self.original_time = default_seconds
             self.start_time = None
             # Reset notifications for new timer
-            self.notifications_sent.clear()
+            self.notifications_sent = 0
+            self._last_tick = None
             self.stop_flashing()  # Stop any existing flashing
             self.coca_timer.start(default_seconds, self.crop_type, self.planter_type)
 
@@ -1260,8 +1570,9 @@ class CocaTimerOverlay(QWidget):
         """Load configuration from file."""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    config = _loads_config(f.read())
+                    self._config_cache = dict(config)
                     if 'selected_area' in config:
                         self.selected_area = tuple(config['selected_area'])
                         print(f"✅ Loaded COCA area: {self.selected_area}")
@@ -1283,27 +1594,53 @@ class CocaTimerOverlay(QWidget):
                     if 'auto_detect_crop' in config:
                         self.auto_detect_crop = config['auto_detect_crop']
                         print(f"✅ Loaded auto-detect crop: {self.auto_detect_crop}")
+                    if config.get('ocr_mode') in ("fast", "thorough"):
+                        self.ocr_mode = config['ocr_mode']
+                        print(f"✅ Loaded OCR mode: '{self.ocr_mode}'")
         except Exception as e:
             print(f"⚠️ Error loading config: {e}")
     
     def save_config(self):
-        """Save configuration to file."""
-        try:
-            config = {}
-            if self.selected_area:
-                config['selected_area'] = list(self.selected_area)
-            config['position_mode'] = self.position_mode
-            config['trigger_start'] = self.trigger_start
-            config['trigger_reset'] = self.trigger_reset
-            config['crop_type'] = self.crop_type
-            config['planter_type'] = self.planter_type
-            config['auto_detect_crop'] = self.auto_detect_crop
-
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            print("✅ Saved COCA config")
-        except Exception as e:
-            print(f"⚠️ Error saving config: {e}")
+        """Schedule a config save; changes within 500 ms are written once."""
+        # Also called from the keyboard and area selector threads, and a
+        # QTimer may only be started from the thread that owns it
+        QMetaObject.invokeMethod(self._save_timer, "start", Qt.ConnectionType.QueuedConnection)
+
+    def _flush_config(self, background=True):
+        """Snapshot the configuration and write it to file."""
+        config = {}
+        if self.selected_area:
+            config['selected_area'] = list(self.selected_area)
+        config['position_mode'] = self.position_mode
+        config['trigger_start'] = self.trigger_start
+        config['trigger_reset'] = self.trigger_reset
+        config['crop_type'] = self.crop_type
+        config['planter_type'] = self.planter_type
+        config['auto_detect_crop'] = self.auto_detect_crop
+        config['ocr_mode'] = self.ocr_mode
+
+        # Re-selecting the same area or option leaves the file as it is
+        if config == self._config_cache:
+            return
+        self._config_cache = config
+
+        if background:
+            threading.Thread(target=self._write_config, args=(config,), daemon=True).start()
+        else:
+            self._write_config(config)
+
+    def _write_config(self, config):
+        """Write a config snapshot atomically."""
+        with self._config_lock:
+            try:
+                temp_file = self.config_file + '.tmp'
+                with open(temp_file, 'wb') as f:
+                    f.write(_dumps_config(config))
+                os.replace(temp_file, self.config_file)
+                print("✅ Saved COCA config")
+            except Exception as e:
+                self._config_cache = None  # Unknown on-disk state; write next time
+                print(f"⚠️ Error saving config: {e}")
 
     def show_preferences(self):
         """Show preferences dialog."""
@@ -1314,9 +1651,15 @@ class CocaTimerOverlay(QWidget):
                 'auto_detect_crop': self.auto_detect_crop
             }
 
-            dialog = PreferencesDialog(self, current_settings)
-            dialog.preferences_saved.connect(self.on_preferences_saved)
-            dialog.exec()
+            # Build the dialog on first use and reuse it afterwards, refreshing
+            # its controls from the current settings each time
+            if self._prefs_dialog is None:
+                self._prefs_dialog = PreferencesDialog(self, current_settings)
+                self._prefs_dialog.preferences_saved.connect(self.on_preferences_saved)
+            else:
+                self._prefs_dialog.current_settings = current_settings
+                self._prefs_dialog.load_current_settings()
+            self._prefs_dialog.exec()
         except Exception as e:
             print(f"⚠️ Error showing preferences: {e}")
 
@@ -1337,7 +1680,7 @@ class CocaTimerOverlay(QWidget):
             print(f"✅ Preferences updated: {self.crop_type} in {self.planter_type}, auto-detect {auto_status}")
 
             # Update tray menu to reflect changes
-            self.create_tray_menu()
+            self.update_tray_menu_state()
 
         except Exception as e:
             print(f"⚠️ Error saving preferences: {e}")
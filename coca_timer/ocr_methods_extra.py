@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Extra OCR Methods for COCA Timer
+Slower preprocessing variants tried only in thorough OCR mode, when the
+standard pass finds no percentage. Loaded on demand by CocaTimer.
+"""
+
+import bisect
+from typing import Optional, List
+import numpy as np
+import cv2
+
+# Handle both relative and absolute imports
+try:
+    from .debug_logger import debug_logger
+    from .coca_timer import rgb_to_gray, _PCT_CHARS
+except ImportError:
+    from debug_logger import debug_logger
+    from coca_timer import rgb_to_gray, _PCT_CHARS
+
+# Same 3x3 kernel as PIL's ImageFilter.SHARPEN
+_PIL_SHARPEN_KERNEL = np.array([[-2, -2, -2],
+                                [-2, 32, -2],
+                                [-2, -2, -2]], dtype=np.float32) / 16
+_MORPH_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+
+# Blank band (px) between variants stacked for a batched tesseract run
+_OCR_BATCH_GAP = 20
+
+# Thresholds tried for white in-game text with black outlines
+_BINARY_THRESHOLDS = (200, 180, 150)
+
+# Modes tried per variant after the batched block-segmentation pass
+_BINARY_PSM_MODES = (8, 7, 13)
+_FALLBACK_PSM_MODES = (8,)
+
+
+def run_thorough(timer, image: np.ndarray) -> Optional[float]:
+    """
+    Try every extra OCR method in turn.
+
+    The block-segmentation pass of every single-image variant is batched
+    into one tesseract run first; each method then only runs its
+    remaining page segmentation modes.
+
+    Args:
+        timer: CocaTimer providing the shared preprocessing/parsing helpers
+        image: Screenshot image as numpy array
+
+    Returns:
+        First non-zero percentage found, else 0.0 if only zero was read, else None
+    """
+    variants = [(f"Binary {t}", lambda img, t=t: preprocess_binary(img, t), _BINARY_PSM_MODES)
+                for t in _BINARY_THRESHOLDS]
+    variants += [
+        ("High Contrast", preprocess_high_contrast, ()),
+        ("Grayscale + Sharpen", preprocess_grayscale_sharpen, _FALLBACK_PSM_MODES),
+        ("Morphological", preprocess_morphological, _FALLBACK_PSM_MODES),
+    ]
+
+    prepared = []
+    for method_name, preprocess, psm_modes in variants:
+        try:
+            prepared.append((method_name, preprocess(image), psm_modes))
+        except Exception as e:
+            debug_logger.log("ERROR", f"{method_name} preprocessing failed: {e}")
+
+    zero_result = None
+    try:
+        texts = ocr_batched(timer, [rgb_to_gray(img) for _, img, _ in prepared])
+    except Exception as e:
+        # Fall back to a separate block-segmentation pass per variant
+        debug_logger.log("ERROR", f"Batched thorough OCR pass failed: {e}")
+        prepared = [(method_name, img, (6,) + psm_modes) for method_name, img, psm_modes in prepared]
+        texts = []
+
+    for (method_name, _, _), text in zip(prepared, texts):
+        debug_logger.log_ocr_attempt(method_name, "--psm 6 (batched)", text, '%' in text)
+        percentages = timer.extract_percentages(text)
+        if not percentages:
+            continue
+        debug_logger.log_percentage_extraction(text, percentages, method_name)
+        result = min(percentages)
+        if result > 0:
+            print(f"🔍 COCA OCR: Detected {result}% using {method_name}")
+            return result
+        zero_result = result
+
+    methods = [(method_name, lambda img=img, name=method_name, modes=psm_modes:
+                read_percentage(timer, name, img, modes))
+               for method_name, img, psm_modes in prepared if psm_modes]
+    methods.append(("Multi-Scale", lambda: method_multi_scale(timer, image)))
+
+    for method_name, method_func in methods:
+        result = method_func()
+        if result is None:
+            continue
+        if result > 0:
+            print(f"🔍 COCA OCR: Detected {result}% using {method_name}")
+            return result
+        # Keep looking for a non-zero reading, but remember the 0%
+        zero_result = result
+
+    return zero_result
+
+
+def read_percentage(timer, method_name: str, image: np.ndarray, psm_modes) -> Optional[float]:
+    """
+    Run digit-only OCR passes over one preprocessed image until a percentage is read.
+
+    Args:
+        timer: CocaTimer providing the OCR engine and percentage parsing
+        method_name: Name used in the debug log
+        image: Preprocessed image
+        psm_modes: Page segmentation modes to try, in order
+
+    Returns:
+        Lowest percentage from the first pass that found one, else None
+    """
+    for psm in psm_modes:
+        try:
+            text = timer._ocr_text(image, psm, _PCT_CHARS)
+            debug_logger.log_ocr_attempt(method_name, f"--psm {psm}", text, '%' in text)
+
+            percentages = timer.extract_percentages(text)
+            if percentages:
+                debug_logger.log_percentage_extraction(text, percentages, method_name)
+                return min(percentages)
+        except Exception as e:
+            debug_logger.log("WARNING", f"OCR failed for {method_name} with --psm {psm}: {e}")
+
+    return None
+
+
+def preprocess_binary(image: np.ndarray, threshold: int) -> np.ndarray:
+    """Binarize at a specific threshold for white text with black outlines."""
+    debug_logger.log("DEBUG", f"🔬 Testing binary threshold: {threshold}")
+
+    # Convert to grayscale
+    gray = rgb_to_gray(np.asarray(image))
+
+    # Apply specific binary threshold
+    # For white text with black outlines, we want to keep white pixels (above threshold)
+    _, binary = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
+
+    debug_logger.save_debug_screenshot(binary, f"binary_{threshold}")
+    return binary
+
+
+def preprocess_high_contrast(image: np.ndarray) -> np.ndarray:
+    """Strongly boost contrast and brightness."""
+    arr = np.asarray(image, dtype=np.uint8)
+    gray = rgb_to_gray(arr)
+
+    # Contrast 3.0 around the mean then brightness 1.5, like the
+    # ImageEnhance pair. Clamping between the steps doesn't change the
+    # result, so both fold into one lookup table applied in a single pass.
+    mean = int(gray.mean() + 0.5)
+    lut = np.clip(np.arange(256) * 4.5 - 3 * mean, 0, 255).astype(np.uint8)
+    bright = cv2.LUT(arr, lut)
+
+    debug_logger.save_debug_screenshot(bright, "high_contrast")
+    return bright
+
+
+def preprocess_grayscale_sharpen(image: np.ndarray) -> np.ndarray:
+    """Grayscale with sharpening."""
+    # Convert to grayscale
+    gray = rgb_to_gray(np.asarray(image))
+
+    # Apply sharpening filter (same kernel as ImageFilter.SHARPEN)
+    sharpened = cv2.filter2D(gray, -1, _PIL_SHARPEN_KERNEL, borderType=cv2.BORDER_REPLICATE)
+
+    debug_logger.save_debug_screenshot(sharpened, "grayscale_sharp")
+    return sharpened
+
+
+def preprocess_morphological(image: np.ndarray) -> np.ndarray:
+    """Grayscale with a morphological close to join broken strokes."""
+    # Convert to grayscale
+    gray = rgb_to_gray(np.asarray(image))
+
+    # Apply morphological operations
+    morph = cv2.morphologyEx(gray, cv2.MORPH_CLOSE, _MORPH_KERNEL)
+
+    debug_logger.save_debug_screenshot(morph, "morphological")
+    return morph
+
+
+def method_multi_scale(timer, image: np.ndarray) -> Optional[float]:
+    """Multi-scale OCR method."""
+    try:
+        scales = [1.5, 2.0, 2.5]
+
+        # Enhance once at native size; every scale is resized from it
+        base = timer._preprocess_gray(image)
+        height, width = base.shape
+
+        variants = []
+        for scale in scales:
+            new_size = (int(width * scale), int(height * scale))
+            enhanced = cv2.resize(base, new_size, interpolation=cv2.INTER_LANCZOS4)
+            debug_logger.save_debug_screenshot(enhanced, f"multi_scale_{scale}")
+            variants.append(enhanced)
+
+        # Block segmentation handles all scales in one tesseract run
+        for scale, text in zip(scales, ocr_batched(timer, variants)):
+            debug_logger.log_ocr_attempt(f"Multi-Scale {scale}x", "--psm 6 (batched)", text, '%' in text)
+
+            percentages = timer.extract_percentages(text)
+            if percentages:
+                debug_logger.log_percentage_extraction(text, percentages, f"Multi-Scale {scale}x")
+                return min(percentages)
+
+        # Single-word segmentation needs one image per run
+        for scale, enhanced in zip(scales, variants):
+            text = timer._ocr_text(enhanced, 8, _PCT_CHARS)
+            debug_logger.log_ocr_attempt(f"Multi-Scale {scale}x", "--psm 8", text, '%' in text)
+
+            percentages = timer.extract_percentages(text)
+            if percentages:
+                debug_logger.log_percentage_extraction(text, percentages, f"Multi-Scale {scale}x")
+                return min(percentages)
+
+        return None
+    except Exception as e:
+        debug_logger.log("ERROR", f"Multi-Scale method failed: {e}")
+        return None
+
+
+def ocr_batched(timer, variants: List[np.ndarray]) -> List[str]:
+    """
+    Recognize several preprocessed variants with a single digit-only block pass.
+
+    Variants are stacked into one tall image separated by blank bands, and
+    each recognized token is assigned back to its variant by its top edge.
+
+    Args:
+        timer: CocaTimer providing the OCR engine
+        variants: Grayscale uint8 images
+
+    Returns:
+        Recognized text for each variant, in input order
+    """
+    width = max(variant.shape[1] for variant in variants)
+
+    pieces = []
+    offsets = []
+    y = 0
+    for variant in variants:
+        # Pad with the variant's own background so the bands add no edges
+        h, w = variant.shape[:2]
+        background = int(np.median(np.concatenate((variant[0], variant[-1]))))
+        pieces.append(cv2.copyMakeBorder(variant, _OCR_BATCH_GAP, 0, 0, width - w,
+                                         cv2.BORDER_CONSTANT, value=background))
+        offsets.append(y)
+        y += h + _OCR_BATCH_GAP
+
+    composite = np.vstack(pieces)
+    texts = [[] for _ in variants]
+    for token, top in timer._ocr_words(composite, 6, _PCT_CHARS):
+        texts[max(0, bisect.bisect_right(offsets, top) - 1)].append(token)
+    return [' '.join(tokens) for tokens in texts]
@@ -6,25 +6,170 @@ Matches the exact theme and styling of the trigger word dialog.
 import sys
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QRadioButton, QButtonGroup, QWidget, QSizePolicy, QCheckBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QFont, QPainter, QColor, QPen
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractAnimation, QVariantAnimation, QEasingCurve, QRect, pyqtProperty
+from PyQt6.QtGui import QFont, QPainter, QColor, QPen, QBrush
+
+
+# Preferences dialog styling, matching the trigger word dialog theme
+_PREFS_QSS = """
+#container {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #1a3d2e, stop:0.5 #2d5a47, stop:1 #1a3d2e);
+    border: 3px solid #4a7c59;
+    border-radius: 20px;
+}
+
+#title {
+    color: #e8f5e8;
+    font-size: 20px;
+    font-weight: bold;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    margin-bottom: 8px;
+}
+
+#section_title {
+    color: #e8f5e8;
+    font-size: 17px;
+    font-weight: bold;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    margin: 0px;
+    padding: 8px 0;
+    background: transparent;
+    border: none;
+    text-align: center;
+    min-height: 30px;
+    max-height: 30px;
+}
+
+#crop_option, #planter_option {
+    color: #e8f5e8;
+    font-size: 14px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-weight: 500;
+    padding: 12px 15px 12px 35px;
+    margin: 0px;
+    spacing: 8px;
+    border: none;
+    background: transparent;
+}
+
+#crop_option::indicator, #planter_option::indicator {
+    width: 18px;
+    height: 18px;
+    border-radius: 9px;
+    border: 2px solid #4a7c59;
+    background-color: #2d5a47;
+    margin-right: 8px;
+}
+
+#crop_option::indicator:checked, #planter_option::indicator:checked {
+    background-color: #6b9b73;
+    border: 2px solid #7db87d;
+}
+
+#crop_option::indicator:hover, #planter_option::indicator:hover {
+    border-color: #6b9b73;
+    background-color: #3a6b54;
+}
+
+#crop_option:hover, #planter_option:hover {
+    background-color: rgba(74, 124, 89, 0.15);
+}
+
+#crop_option:disabled, #planter_option:disabled {
+    color: #666666;
+    background-color: rgba(45, 90, 71, 0.3);
+}
+
+#crop_option::indicator:disabled, #planter_option::indicator:disabled {
+    border-color: #666666;
+    background-color: #444444;
+}
+
+#toggle_label {
+    color: #e8f5e8;
+    font-size: 14px;
+    font-family: 'Segoe UI', Arial, sans-serif;
+    font-weight: 500;
+    padding: 5px 0;
+    margin: 0;
+    background: transparent;
+    border: none;
+}
+
+
+
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #3a6b54, stop:1 #2d5a47);
+    border: 2px solid #4a7c59;
+    border-radius: 12px;
+    padding: 12px 25px;
+    color: #e8f5e8;
+    font-size: 14px;
+    font-weight: bold;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4a7c59, stop:1 #3a6b54);
+    border-color: #6b9b73;
+}
+
+QPushButton:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #2d5a47, stop:1 #1a3d2e);
+}
+
+#ok {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #6b9b73, stop:1 #4a7c59);
+    border-color: #6b9b73;
+}
+
+#ok:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #7db87d, stop:1 #6b9b73);
+    border-color: #7db87d;
+}
+
+#ok:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4a7c59, stop:1 #3a6b54);
+}
+
+#cancel:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #d32f2f, stop:1 #b71c1c);
+    border-color: #d32f2f;
+}
+"""
 
 
 class ToggleSwitch(QWidget):
     """Custom toggle switch widget."""
     toggled = pyqtSignal(bool)
 
+    # Paint resources shared by every switch
+    _TRACK_ON = QBrush(QColor(107, 155, 115))   # Green when on
+    _TRACK_OFF = QBrush(QColor(74, 124, 89))    # Darker green when off
+    _CIRCLE = QBrush(QColor(232, 245, 232))     # Light color for circle
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(45, 22)  # Smaller size
+        self._track_rect = QRect(0, 0, 45, 22)  # Fixed size, so computed once
         self.setCheckable(True)
         self._checked = False
         self._circle_position = 2
 
-        # Animation for smooth toggle
-        self.animation = QPropertyAnimation(self, b"circle_position")
+        # Animation for smooth toggle; drives the position directly rather
+        # than through the Qt property system
+        self.animation = QVariantAnimation(self)
         self.animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
         self.animation.setDuration(200)
+        self.animation.valueChanged.connect(self.set_circle_position)
 
     def setCheckable(self, checkable):
         pass
@@ -35,6 +180,7 @@ class ToggleSwitch(QWidget):
     def setChecked(self, checked):
         if self._checked != checked:
             self._checked = checked
+            self.update()  # Track colour changes across the whole widget
             self.move_circle()
             self.toggled.emit(checked)
 
@@ -44,6 +190,11 @@ class ToggleSwitch(QWidget):
         else:
             end_position = 2
 
+        # Already resting at the target: nothing to animate
+        if end_position == self._circle_position and self.animation.state() != QAbstractAnimation.State.Running:
+            return
+
+        self.animation.stop()
         self.animation.setStartValue(self._circle_position)
         self.animation.setEndValue(end_position)
         self.animation.start()
@@ -52,8 +203,11 @@ class ToggleSwitch(QWidget):
         return self._circle_position
 
     def set_circle_position(self, position):
-        self._circle_position = position
-        self.update()
+        old_position, self._circle_position = self._circle_position, position
+        # Only the strip swept by the 18px circle (plus antialiasing) changes
+        # while sliding; setChecked already repainted the recoloured track
+        left = min(old_position, position) - 1
+        self.update(QRect(left, 1, abs(position - old_position) + 20, 20))
 
     circle_position = pyqtProperty(int, get_circle_position, set_circle_position)
 
@@ -66,18 +220,12 @@ class ToggleSwitch(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw background track
-        if self._checked:
-            track_color = QColor(107, 155, 115)  # Green when on
-        else:
-            track_color = QColor(74, 124, 89)    # Darker green when off
-
-        painter.setBrush(track_color)
+        painter.setBrush(self._TRACK_ON if self._checked else self._TRACK_OFF)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(0, 0, self.width(), self.height(), 11, 11)  # Smaller radius
+        painter.drawRoundedRect(self._track_rect, 11, 11)  # Smaller radius
 
         # Draw circle
-        circle_color = QColor(232, 245, 232)  # Light color for circle
-        painter.setBrush(circle_color)
+        painter.setBrush(self._CIRCLE)
         painter.drawEllipse(self._circle_position, 2, 18, 18)  # Smaller circle
 
 
@@ -137,12 +285,7 @@ class PreferencesDialog(QDialog):
         container_layout.addSpacing(20)
 
         # Auto-Detection Section
-        auto_detect_label = QLabel("Detection Mode")
-        auto_detect_label.setObjectName("section_title")
-        auto_detect_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        auto_detect_label.setFixedHeight(30)
-        container_layout.addWidget(auto_detect_label)
-        container_layout.addSpacing(10)
+        self._add_section_title(container_layout, "Detection Mode")
 
         # Auto-detection toggle switch with label
         auto_detect_container = QWidget()
@@ -166,55 +309,30 @@ class PreferencesDialog(QDialog):
         container_layout.addWidget(auto_detect_container)
         container_layout.addSpacing(25)
 
-        # Crop Type Section
-        crop_label = QLabel("Manual Crop Selection")
-        crop_label.setObjectName("section_title")
-        crop_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        crop_label.setFixedHeight(30)
-        container_layout.addWidget(crop_label)
-        container_layout.addSpacing(10)
-
-        # Crop radio buttons
+        # Crop and planter sections: one titled group of radio buttons each,
+        # as (attribute, text) pairs in button id order
         self.crop_group = QButtonGroup()
-
-        self.coca_radio = QRadioButton("🍃 Coca Leaves (38 min)")
-        self.coca_radio.setObjectName("crop_option")
-        self.coca_radio.setFixedHeight(45)
-        self.crop_group.addButton(self.coca_radio, 0)
-        container_layout.addWidget(self.coca_radio)
-        container_layout.addSpacing(8)
-
-        self.marijuana_radio = QRadioButton("🌿 Marijuana (19 min)")
-        self.marijuana_radio.setObjectName("crop_option")
-        self.marijuana_radio.setFixedHeight(45)
-        self.crop_group.addButton(self.marijuana_radio, 1)
-        container_layout.addWidget(self.marijuana_radio)
-        container_layout.addSpacing(25)
-
-        # Planter Type Section
-        planter_label = QLabel("Planter Choice")
-        planter_label.setObjectName("section_title")
-        planter_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        planter_label.setFixedHeight(30)
-        container_layout.addWidget(planter_label)
-        container_layout.addSpacing(10)
-
-        # Planter radio buttons
         self.planter_group = QButtonGroup()
-
-        self.basic_planter_radio = QRadioButton("📦 Basic Planter (Standard time)")
-        self.basic_planter_radio.setObjectName("planter_option")
-        self.basic_planter_radio.setFixedHeight(45)
-        self.planter_group.addButton(self.basic_planter_radio, 0)
-        container_layout.addWidget(self.basic_planter_radio)
-        container_layout.addSpacing(8)
-
-        self.planter_box_radio = QRadioButton("🏗️ Planter Box (5% faster)")
-        self.planter_box_radio.setObjectName("planter_option")
-        self.planter_box_radio.setFixedHeight(45)
-        self.planter_group.addButton(self.planter_box_radio, 1)
-        container_layout.addWidget(self.planter_box_radio)
-        container_layout.addSpacing(40)
+        sections = (
+            ("Manual Crop Selection", self.crop_group, "crop_option", 25, (
+                ("coca_radio", "🍃 Coca Leaves (38 min)"),
+                ("marijuana_radio", "🌿 Marijuana (19 min)"),
+            )),
+            ("Planter Choice", self.planter_group, "planter_option", 40, (
+                ("basic_planter_radio", "📦 Basic Planter (Standard time)"),
+                ("planter_box_radio", "🏗️ Planter Box (5% faster)"),
+            )),
+        )
+        for title, group, object_name, spacing_after, options in sections:
+            self._add_section_title(container_layout, title)
+            for button_id, (attribute, text) in enumerate(options):
+                radio = QRadioButton(text)
+                radio.setObjectName(object_name)
+                radio.setFixedHeight(45)
+                group.addButton(radio, button_id)
+                setattr(self, attribute, radio)
+                container_layout.addWidget(radio)
+                container_layout.addSpacing(8 if button_id < len(options) - 1 else spacing_after)
 
         # Button layout
         button_layout = QHBoxLayout()
@@ -242,142 +360,24 @@ class PreferencesDialog(QDialog):
         # Add container to main layout
         main_layout.addWidget(self.container)
 
-    def setup_styling(self):
-        """Apply modern styling matching the trigger dialog theme."""
-        self.setStyleSheet("""
-            #container {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a3d2e, stop:0.5 #2d5a47, stop:1 #1a3d2e);
-                border: 3px solid #4a7c59;
-                border-radius: 20px;
-            }
-
-            #title {
-                color: #e8f5e8;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                margin-bottom: 8px;
-            }
-
-            #section_title {
-                color: #e8f5e8;
-                font-size: 17px;
-                font-weight: bold;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                margin: 0px;
-                padding: 8px 0;
-                background: transparent;
-                border: none;
-                text-align: center;
-                min-height: 30px;
-                max-height: 30px;
-            }
-
-            #crop_option, #planter_option {
-                color: #e8f5e8;
-                font-size: 14px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-                padding: 12px 15px 12px 35px;
-                margin: 0px;
-                spacing: 8px;
-                border: none;
-                background: transparent;
-            }
-
-            #crop_option::indicator, #planter_option::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 9px;
-                border: 2px solid #4a7c59;
-                background-color: #2d5a47;
-                margin-right: 8px;
-            }
-
-            #crop_option::indicator:checked, #planter_option::indicator:checked {
-                background-color: #6b9b73;
-                border: 2px solid #7db87d;
-            }
-
-            #crop_option::indicator:hover, #planter_option::indicator:hover {
-                border-color: #6b9b73;
-                background-color: #3a6b54;
-            }
-
-            #crop_option:hover, #planter_option:hover {
-                background-color: rgba(74, 124, 89, 0.15);
-            }
-
-            #crop_option:disabled, #planter_option:disabled {
-                color: #666666;
-                background-color: rgba(45, 90, 71, 0.3);
-            }
-
-            #crop_option::indicator:disabled, #planter_option::indicator:disabled {
-                border-color: #666666;
-                background-color: #444444;
-            }
-
-            #toggle_label {
-                color: #e8f5e8;
-                font-size: 14px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-weight: 500;
-                padding: 5px 0;
-                margin: 0;
-                background: transparent;
-                border: none;
-            }
-
-
-
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3a6b54, stop:1 #2d5a47);
-                border: 2px solid #4a7c59;
-                border-radius: 12px;
-                padding: 12px 25px;
-                color: #e8f5e8;
-                font-size: 14px;
-                font-weight: bold;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a7c59, stop:1 #3a6b54);
-                border-color: #6b9b73;
-            }
-
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2d5a47, stop:1 #1a3d2e);
-            }
-
-            #ok {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #6b9b73, stop:1 #4a7c59);
-                border-color: #6b9b73;
-            }
-
-            #ok:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #7db87d, stop:1 #6b9b73);
-                border-color: #7db87d;
-            }
+    def _add_section_title(self, layout, text):
+        """
+        Add a centred section heading followed by its spacing.
 
-            #ok:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a7c59, stop:1 #3a6b54);
-            }
+        Args:
+            layout: Container layout to add the heading to
+            text: Heading text
+        """
+        label = QLabel(text)
+        label.setObjectName("section_title")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setFixedHeight(30)
+        layout.addWidget(label)
+        layout.addSpacing(10)
 
-            #cancel:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #d32f2f, stop:1 #b71c1c);
-                border-color: #d32f2f;
-            }
-        """)
+    def setup_styling(self):
+        """Apply modern styling matching the trigger dialog theme."""
+        self.setStyleSheet(_PREFS_QSS)
 
     def center_on_screen(self):
         """Center the dialog on screen."""
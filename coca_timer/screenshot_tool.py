@@ -4,6 +4,7 @@ Screenshot Tool for COCA Timer
 Handles screen capture functionality using mss for fast screenshots.
 """
 
+import threading
 import numpy as np
 from typing import Optional, Tuple
 
@@ -17,13 +18,59 @@ except ImportError:
     print("⚠️ Screenshot not available - install mss")
 
 
+def _bgra_to_rgb(screenshot) -> np.ndarray:
+    """
+    Convert an mss screenshot to a contiguous RGB array with a single copy.
+
+    Args:
+        screenshot: mss ScreenShot with raw BGRA pixels
+
+    Returns:
+        HxWx3 uint8 RGB array
+    """
+    # View the raw BGRA buffer in place, then copy the reversed B, G, R
+    # channels out once (no intermediate 4-channel copy or gather indices)
+    bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+    return np.ascontiguousarray(bgra[:, :, 2::-1])
+
+
+class _ThreadMSS:
+    """Holds one thread's mss instance and closes it when the thread's locals are dropped."""
+
+    __slots__ = ('sct', 'region')
+
+    def __init__(self):
+        self.sct = mss.mss()
+        # Grab region reused by capture_area, filled in place per call
+        self.region = {"top": 0, "left": 0, "width": 0, "height": 0}
+
+    def __del__(self):
+        try:
+            self.sct.close()
+        except Exception:
+            pass
+
+
 class ScreenshotTool:
     """Fast screenshot capture tool using mss."""
 
     def __init__(self):
         """Initialize screenshot tool."""
-        self.sct = None
-        # Don't initialize mss here - do it per capture to avoid threading issues
+        # mss handles are not shared across threads, so each capturing thread
+        # lazily opens its own and keeps reusing it
+        self._tls = threading.local()
+
+    def _thread_mss(self) -> _ThreadMSS:
+        """Get the calling thread's mss state, creating it on first use."""
+        holder = getattr(self._tls, 'holder', None)
+        if holder is None:
+            holder = self._tls.holder = _ThreadMSS()
+        return holder
+
+    def close(self):
+        """Release the calling thread's mss instance."""
+        if getattr(self._tls, 'holder', None) is not None:
+            del self._tls.holder
     
     def capture_full_screen(self) -> Optional[np.ndarray]:
         """
@@ -37,21 +84,16 @@ class ScreenshotTool:
             return None
 
         try:
-            # Create new mss instance to avoid threading issues
+            # Capture primary monitor. mss caches its monitor list, so a fresh
+            # instance picks up resolution or primary-monitor changes; this
+            # only runs once per area selection
             with mss.mss() as sct:
-                # Capture primary monitor
-                monitor = sct.monitors[1]  # Primary monitor
-                screenshot = sct.grab(monitor)
+                screenshot = sct.grab(sct.monitors[1])
 
-                # Convert to numpy array
-                img_array = np.array(screenshot)
+            img_array = _bgra_to_rgb(screenshot)
 
-                # Convert BGRA to RGB
-                if img_array.shape[2] == 4:  # BGRA
-                    img_array = img_array[:, :, [2, 1, 0]]  # BGR to RGB
-
-                print(f"📸 Full screen captured: {img_array.shape}")
-                return img_array
+            print(f"📸 Full screen captured: {img_array.shape}")
+            return img_array
 
         except Exception as e:
             print(f"⚠️ Error capturing full screen: {e}")
@@ -72,30 +114,18 @@ class ScreenshotTool:
             return None
 
         try:
-            x, y, width, height = area
-
             # Define monitor region
-            monitor = {
-                "top": y,
-                "left": x,
-                "width": width,
-                "height": height
-            }
-
-            # Create new mss instance to avoid threading issues
-            with mss.mss() as sct:
-                # Capture area
-                screenshot = sct.grab(monitor)
+            state = self._thread_mss()
+            region = state.region
+            region["left"], region["top"], region["width"], region["height"] = area
 
-                # Convert to numpy array
-                img_array = np.array(screenshot)
+            # Capture area
+            screenshot = state.sct.grab(region)
 
-                # Convert BGRA to RGB
-                if img_array.shape[2] == 4:  # BGRA
-                    img_array = img_array[:, :, [2, 1, 0]]  # BGR to RGB
+            img_array = _bgra_to_rgb(screenshot)
 
-                print(f"📸 Area captured: {img_array.shape} from {area}")
-                return img_array
+            print(f"📸 Area captured: {img_array.shape} from {area}")
+            return img_array
 
         except Exception as e:
             print(f"⚠️ Error capturing area {area}: {e}")
@@ -112,9 +142,10 @@ class ScreenshotTool:
             return (1920, 1080)  # Default fallback
 
         try:
+            # Fresh instance for current bounds, as in capture_full_screen
             with mss.mss() as sct:
-                monitor = sct.monitors[1]  # Primary monitor
-                return (monitor["width"], monitor["height"])
+                monitor = sct.monitors[1]
+            return (monitor["width"], monitor["height"])
         except Exception as e:
             print(f"⚠️ Error getting screen size: {e}")
             return (1920, 1080)  # Default fallback